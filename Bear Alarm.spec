@@ -2,7 +2,7 @@
 
 
 a = Analysis(
-    ['/Users/miguel/miguelbranco80/bear-alarm/src/main_qt.py'],
+    ['/Users/miguel/miguelbranco80/bear-alarm/src/main.py'],
     pathex=[],
     binaries=[],
     datas=[('/Users/miguel/miguelbranco80/bear-alarm/resources/sounds', 'resources/sounds'), ('/Users/miguel/miguelbranco80/bear-alarm/resources/icons', 'resources/icons')],
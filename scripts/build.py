@@ -76,7 +76,7 @@ def build_macos():
     print("🔨 Building macOS app...")
     
     # Paths
-    main_script = ROOT / "src" / "main_qt.py"
+    main_script = ROOT / "src" / "main.py"
     resources_dir = ROOT / "resources"
     icon_path = resources_dir / "icons" / "AppIcon.icns"
     
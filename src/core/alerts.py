@@ -30,6 +30,18 @@ class AlertSystem:
     at configurable intervals until levels return to normal.
     """
 
+    __slots__ = (
+        "low_alert_sound",
+        "high_alert_sound",
+        "alert_interval",
+        "alert_repeat_count",
+        "_current_state",
+        "_alert_thread",
+        "_stop_alert_event",
+        "_mixer_initialized",
+        "_music_initialized",
+    )
+
     def __init__(
         self,
         low_alert_sound: str,
@@ -2,7 +2,7 @@
 
 import logging
 import os
-from datetime import time
+from datetime import datetime, time
 from pathlib import Path
 from typing import Optional
 
@@ -78,6 +78,12 @@ class ScheduleConfig(BaseModel):
     low_persist_minutes: Optional[int] = Field(default=None, description="Override low persistence")
     high_persist_minutes: Optional[int] = Field(default=None, description="Override high persistence")
     
+    @field_validator("low_threshold", "high_threshold")
+    @classmethod
+    def round_thresholds(cls, v: Optional[float]) -> Optional[float]:
+        """Keep overrides to the one decimal the rules view shows and edits."""
+        return round(v, 1) if v is not None else None
+    
     def get_start_time(self) -> time:
         """Parse start time string to time object."""
         parts = self.start_time.split(":")
@@ -88,13 +94,13 @@ class ScheduleConfig(BaseModel):
         parts = self.end_time.split(":")
         return time(int(parts[0]), int(parts[1]))
     
-    def is_active_now(self) -> bool:
-        """Check if this schedule is currently active."""
+    def is_active_now(self, now: Optional[datetime] = None) -> bool:
+        """Check if this schedule is active at now (default: the current time)."""
         if not self.enabled:
             return False
         
-        from datetime import datetime
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         
         # Check day of week
         if now.weekday() not in self.days:
@@ -187,6 +193,12 @@ class AlertsConfig(BaseModel):
         default_factory=list, description="Emergency contacts for critical alerts"
     )
 
+    @field_validator("urgent_low", "low_threshold", "high_threshold")
+    @classmethod
+    def round_thresholds(cls, v: float) -> float:
+        """Keep thresholds to the one decimal the rules view shows and edits."""
+        return round(v, 1)
+
     @field_validator("high_threshold")
     @classmethod
     def validate_thresholds(cls, v: float, info) -> float:
@@ -203,17 +215,23 @@ class AlertsConfig(BaseModel):
         """Get resolved path to high alert sound."""
         return resolve_sound_path(self.high_alert_sound)
     
-    def get_active_schedule(self) -> Optional[ScheduleConfig]:
+    def get_active_schedule(self, now: Optional[datetime] = None) -> Optional[ScheduleConfig]:
         """Get the highest-priority currently active schedule, or None."""
-        active = [s for s in self.schedules if s.is_active_now()]
+        if not self.schedules:
+            return None
+        
+        # One clock read shared by every schedule
+        if now is None:
+            now = datetime.now()
+        active = [s for s in self.schedules if s.is_active_now(now)]
         if not active:
             return None
         # Return highest priority
         return max(active, key=lambda s: s.priority)
     
-    def get_effective_thresholds(self) -> ThresholdsConfig:
+    def get_effective_thresholds(self, now: Optional[datetime] = None) -> ThresholdsConfig:
         """Get the currently effective thresholds (considering active schedule)."""
-        schedule = self.get_active_schedule()
+        schedule = self.get_active_schedule(now)
         
         if schedule is None:
             return ThresholdsConfig(
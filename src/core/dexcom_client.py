@@ -2,6 +2,7 @@
 
 import logging
 import time
+from datetime import datetime, timezone
 from typing import Optional
 
 from pydexcom import Dexcom, GlucoseReading, Region
@@ -28,6 +29,15 @@ class DexcomClient:
     robust error handling with automatic reconnection.
     """
 
+    __slots__ = (
+        "username",
+        "password",
+        "region",
+        "_client",
+        "_last_connection_attempt",
+        "_connection_retry_delay",
+    )
+
     def __init__(self, username: str, password: str, region: str = "us"):
         """
         Initialize Dexcom client.
@@ -121,7 +131,6 @@ class DexcomClient:
                     return None
                 
                 # Check if reading is stale (older than 15 minutes)
-                from datetime import datetime, timezone
                 age = datetime.now(timezone.utc) - reading.datetime.replace(tzinfo=timezone.utc)
                 age_minutes = age.total_seconds() / 60
                 
@@ -1,7 +1,7 @@
 """Glucose monitoring service with continuous polling and alerting."""
 
 import logging
-import time
+import threading
 from typing import Optional
 
 from .alerts import AlertSystem
@@ -19,6 +19,16 @@ class GlucoseMonitor:
     configured thresholds, and triggers alerts when necessary.
     """
 
+    __slots__ = (
+        "config",
+        "running",
+        "_stop_event",
+        "dexcom_client",
+        "alert_system",
+        "_consecutive_errors",
+        "_max_consecutive_errors",
+    )
+
     def __init__(self, config: Config):
         """
         Initialize glucose monitor.
@@ -28,6 +38,7 @@ class GlucoseMonitor:
         """
         self.config = config
         self.running = False
+        self._stop_event = threading.Event()
 
         # Initialize Dexcom client
         logger.info("Initializing Dexcom client...")
@@ -84,15 +95,19 @@ class GlucoseMonitor:
                 logger.info("Glucose returned to normal range")
             self.alert_system.clear_alert()
 
-    def _poll_once(self) -> bool:
+    def _poll_once(self, glucose_mmol: Optional[float] = None) -> bool:
         """
         Poll glucose level once and check thresholds.
 
+        Args:
+            glucose_mmol: Reading already fetched this cycle, to skip the request
+
         Returns:
             True if successful, False if error occurred
         """
         try:
-            glucose_mmol = self.dexcom_client.get_glucose_mmol()
+            if glucose_mmol is None:
+                glucose_mmol = self.dexcom_client.get_glucose_mmol()
 
             if glucose_mmol is None:
                 logger.warning("No glucose reading available")
@@ -138,9 +153,14 @@ class GlucoseMonitor:
             f"Alert interval: {self.config.alerts.alert_interval}s"
         )
 
-        # Test connection
+        # Test connection - the reading doubles as the first poll
         logger.info("Testing connection to Dexcom Share...")
-        if not self.dexcom_client.test_connection():
+        try:
+            first_glucose = self.dexcom_client.get_glucose_mmol()
+        except DexcomClientError as e:
+            logger.error(f"Connection test failed: {e}")
+            first_glucose = None
+        if first_glucose is None:
             logger.error("Failed to connect to Dexcom Share")
             raise RuntimeError(
                 "Cannot connect to Dexcom Share. "
@@ -154,17 +174,21 @@ class GlucoseMonitor:
                 f"Waiting {self.config.monitoring.startup_delay} seconds before "
                 f"starting monitoring..."
             )
-            time.sleep(self.config.monitoring.startup_delay)
+            if self._stop_event.wait(self.config.monitoring.startup_delay):
+                return
+            first_glucose = None  # Stale after the delay, fetch a fresh one
 
         self.running = True
         logger.info("Monitoring started - Press Ctrl+C to stop")
 
         try:
-            while self.running:
-                self._poll_once()
+            while True:
+                self._poll_once(first_glucose)
+                first_glucose = None
 
-                # Sleep until next poll
-                time.sleep(self.config.monitoring.poll_interval)
+                # Sleep until next poll, waking early if stopped
+                if self._stop_event.wait(self.config.monitoring.poll_interval):
+                    break
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
@@ -172,6 +196,7 @@ class GlucoseMonitor:
 
     def stop(self) -> None:
         """Stop the monitoring service."""
+        self._stop_event.set()
         if not self.running:
             return
 
@@ -3,6 +3,7 @@
 import os
 import platform
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -57,10 +58,13 @@ def get_user_config_path() -> Path:
     return get_user_data_dir() / "config.yaml"
 
 
+@lru_cache(maxsize=16)
 def resolve_sound_path(sound_path: str) -> Path:
     """
     Resolve a sound file path to an absolute path.
     
+    Results are cached; the bundle location is fixed for the process.
+    
     Args:
         sound_path: Path string like "sounds/alarm.wav"
         
@@ -3,6 +3,7 @@
 import atexit
 import logging
 import platform
+import re
 import subprocess
 from typing import Optional, Tuple
 
@@ -10,6 +11,34 @@ logger = logging.getLogger(__name__)
 
 _caffeinate_process: Optional[subprocess.Popen] = None
 
+
+def _get_macos_volume_settings() -> Tuple[Optional[int], Optional[bool]]:
+    """
+    Read macOS output volume and mute state with a single osascript call.
+    
+    Returns:
+        Tuple of (volume 0-100, muted), either None if unable to detect.
+    """
+    try:
+        result = subprocess.run(
+            ["osascript", "-e", "get volume settings"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+        )
+        if result.returncode == 0:
+            # e.g. "output volume:50, input volume:75, alert volume:100, output muted:false"
+            volume_match = re.search(r'output volume:(\d+)', result.stdout)
+            muted_match = re.search(r'output muted:(\w+)', result.stdout)
+            volume = int(volume_match.group(1)) if volume_match else None
+            muted = muted_match.group(1).lower() == "true" if muted_match else None
+            return volume, muted
+    except Exception as e:
+        logger.debug(f"Failed to get macOS volume settings: {e}")
+    
+    return None, None
+
+
 def get_system_volume() -> Optional[int]:
     """
     Get the current system volume level.
@@ -58,7 +87,6 @@ def get_system_volume() -> Optional[int]:
             )
             if result.returncode == 0:
                 # Parse output like "[50%]"
-                import re
                 match = re.search(r'\[(\d+)%\]', result.stdout)
                 if match:
                     return int(match.group(1))
@@ -105,11 +133,15 @@ def check_volume_status(min_volume: int = 30) -> Tuple[bool, str]:
         - is_ok: True if volume is adequate
         - message: Warning message if not ok, empty string if ok
     """
-    muted = is_muted()
+    if platform.system() == "Darwin":
+        # One osascript spawn instead of separate mute and volume queries
+        volume, muted = _get_macos_volume_settings()
+    else:
+        volume, muted = get_system_volume(), is_muted()
+    
     if muted is True:
         return False, "🔇 MUTED"
     
-    volume = get_system_volume()
     if volume is not None and volume < min_volume:
         return False, f"🔈 Volume low: {volume}%"
     
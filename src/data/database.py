@@ -18,6 +18,8 @@ SCHEMA_VERSION = 1
 class Database:
     """SQLite database manager for Bear Alarm."""
 
+    __slots__ = ("db_path", "_conn")
+
     def __init__(self, db_path: Optional[Path] = None):
         """
         Initialize database connection.
@@ -1,7 +1,7 @@
 """Data models for Bear Alarm."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
@@ -35,7 +35,7 @@ class TrendDirection(Enum):
         return arrows.get(self, "?")
 
 
-@dataclass
+@dataclass(slots=True)
 class GlucoseReading:
     """A single glucose reading."""
     
@@ -67,7 +67,7 @@ class GlucoseReading:
         return self.glucose_mmol >= 10.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SnoozeEvent:
     """A snooze event record."""
     
@@ -89,7 +89,6 @@ class SnoozeEvent:
     @property
     def ends_at(self) -> datetime:
         """Get when snooze ends."""
-        from datetime import timedelta
         return self.started_at + timedelta(minutes=self.duration_minutes)
     
     @property
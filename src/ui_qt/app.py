@@ -1,30 +1,76 @@
 """Main Qt application for Bear Alarm."""
 
+import gc
 import logging
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QPushButton, QSystemTrayIcon, QMenu,
-    QMessageBox, QFrame
+    QMessageBox, QFrame, QToolBar, QStatusBar
 )
 from PySide6.QtGui import QIcon, QAction, QCloseEvent
 
 from .theme import apply_theme, STYLESHEET
-from .views import DashboardView, HistoryView, RulesView, ContactsView, SettingsView
+from .views import DashboardView
 from ..core import (
     Config, load_config, save_config, DexcomClient, DexcomClientError,
     AlertSystem, prevent_sleep, allow_sleep, check_volume_status,
-    resolve_sound_path, call_facetime,
+    resolve_sound_path, call_facetime, get_resources_dir,
 )
 from ..data import Database
 from ..data.models import TrendDirection
 
 logger = logging.getLogger(__name__)
 
+# Seconds between volume checks while the monitor waits for the next poll
+VOLUME_CHECK_INTERVAL = 30
+
+# Fallback arrows for Dexcom trend descriptions, keyed lowercase
+TREND_ARROWS = {
+    "steady": "→", "flat": "→",
+    "rising": "↗", "fortyfiveup": "↗",
+    "falling": "↘", "fortyfivedown": "↘",
+    "risingquickly": "⬆", "singleup": "⬆",
+    "fallingquickly": "⬇", "singledown": "⬇",
+    "risingrapidly": "⬆⬆", "doubleup": "⬆⬆",
+    "fallingrapidly": "⬇⬇", "doubledown": "⬇⬇",
+}
+
+# Scale CPython's default gen0 GC threshold (700) for a long-running app
+GC_GEN0_MULTIPLIER = 16
+
+
+@contextmanager
+def _paused_gc():
+    """Hold off cyclic GC during a burst of allocations, then collect once."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+        gc.collect(generation=1)
+
+
+def _alert_settings(config: Config) -> tuple:
+    """The config fields the AlertSystem is built from."""
+    alerts = config.alerts
+    return (alerts.low_alert_sound, alerts.high_alert_sound, alerts.alert_interval, alerts.alert_repeat_count)
+
+
+class AppSignals(QObject):
+    """Signals for updates posted from worker threads."""
+    volume_status = Signal(str)
+    save_failed = Signal(str)
+
 
 class BearAlarmApp(QMainWindow):
     """Main application window."""
@@ -36,30 +82,46 @@ class BearAlarmApp(QMainWindow):
         self.db: Optional[Database] = None
         self.dexcom_client: Optional[DexcomClient] = None
         self.alert_system: Optional[AlertSystem] = None
+        self.signals = AppSignals()
+        self.signals.volume_status.connect(self._on_volume_status)
+        self.signals.save_failed.connect(self._on_save_failed)
         
         self._stop_monitoring = threading.Event()
         self._monitor_thread: Optional[threading.Thread] = None
-        self._is_snoozed = False
-        self._snooze_until: Optional[datetime] = None
+        self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh")
+        self._refresh_future: Optional[Future] = None
+        # One worker keeps config writes off the UI thread and in order
+        self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
+        self._snooze_until: Optional[datetime] = None  # For display only
+        self._snooze_until_monotonic = 0.0  # 0.0 means not snoozed
         self._current_glucose: Optional[float] = None
-        
-        # Persistence tracking for smart alerts
-        self._last_low_alert_start_time: Optional[datetime] = None
-        self._last_high_alert_start_time: Optional[datetime] = None
+        self._alert_active = False
+        self._volume_text: Optional[str] = None
+        self._shut_down = False
+        # Guards _refresh_future, refresh submits and closing the database
+        # against the UI thread, the monitor thread and _shutdown racing
+        self._db_lock = threading.Lock()
+        self._monitor_done = False
+        
+        # Persistence tracking for smart alerts (time.monotonic() values)
+        self._last_low_alert_start_time: Optional[float] = None
+        self._last_high_alert_start_time: Optional[float] = None
         
         self._init_app()
 
     def _init_app(self) -> None:
         """Initialize the application."""
+        # Fewer gen0 collections in the long-running monitor
+        _, gen1, gen2 = gc.get_threshold()
+        gc.set_threshold(700 * GC_GEN0_MULTIPLIER, gen1, gen2)
+        
         self.setWindowTitle("Bear Alarm")
         self.setMinimumSize(520, 500)
         self.resize(550, 580)
         
         # Set app icon
-        from ..core.paths import get_resources_dir
-        icon_path = get_resources_dir() / "icons" / "bear-icon.png"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        self._icon = self._load_icon()
+        self.setWindowIcon(self._icon)
         
         # Initialize components
         self._init_database()
@@ -68,14 +130,22 @@ class BearAlarmApp(QMainWindow):
         self._init_alerts()
         
         # Build UI
-        self._build_ui()
-        self._setup_tray()
-        self._setup_timers()
+        with _paused_gc():
+            self._build_ui()
+            self._setup_tray()
         
         # Start monitoring
         prevent_sleep()
         self._start_monitoring()
 
+    def _load_icon(self) -> QIcon:
+        """Load the app icon from resources, falling back to a stock icon."""
+        icon_path = get_resources_dir() / "icons" / "bear-icon.png"
+        icon = QIcon(str(icon_path))
+        if icon.isNull():
+            icon = self.style().standardIcon(self.style().StandardPixmap.SP_ComputerIcon)
+        return icon
+
     def _init_database(self) -> None:
         """Initialize database."""
         try:
@@ -116,12 +186,9 @@ class BearAlarmApp(QMainWindow):
             except Exception as e:
                 logger.error(f"Failed to initialize alert system: {e}")
 
-    def _build_ui(self) -> None:
-        """Build the main UI."""
+    def _build_chrome(self) -> None:
+        """Build the static window chrome (toolbar and status bar)."""
         # Use native toolbar
-        from PySide6.QtWidgets import QToolBar, QStatusBar
-        from PySide6.QtGui import QAction
-        
         toolbar = QToolBar()
         toolbar.setMovable(False)
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
@@ -144,6 +211,10 @@ class BearAlarmApp(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._volume_warning = QLabel("")
         self._status_bar.addPermanentWidget(self._volume_warning)
+
+    def _build_ui(self) -> None:
+        """Build the main UI."""
+        self._build_chrome()
         
         central = QWidget()
         self.setCentralWidget(central)
@@ -163,57 +234,69 @@ class BearAlarmApp(QMainWindow):
         )
         self._tabs.addTab(self._dashboard, "Dashboard")
         
-        # History
-        self._history = HistoryView(
-            get_readings=lambda hours: self.db.get_readings_for_chart(hours) if self.db else [],
-            get_stats=lambda hours: self.db.get_stats(hours) if self.db else {},
-        )
-        self._tabs.addTab(self._history, "History")
-        
-        # Rules
-        self._rules = RulesView(
-            config=self.config,
-            on_save=self._handle_save_settings,
-        )
-        self._tabs.addTab(self._rules, "Rules")
-        
-        # Contacts
-        self._contacts = ContactsView(
-            config=self.config,
-            on_save=self._handle_save_settings,
-            on_call=self._handle_call_contact,
-        )
-        self._tabs.addTab(self._contacts, "Contacts")
-        
-        # Settings
-        self._settings = SettingsView(
-            config=self.config,
-            on_save=self._handle_save_settings,
-            on_test_sound=self._handle_test_sound,
-        )
-        self._tabs.addTab(self._settings, "Settings")
-        
-        # Tab change handler
-        self._tabs.currentChanged.connect(self._on_tab_changed)
-        
         layout.addWidget(self._tabs)
         
         # Update contacts on dashboard
         if self.config:
             self._dashboard.update_contacts(self.config.alerts.emergency_contacts)
+        
+        # Remaining tabs are built once the window has painted
+        QTimer.singleShot(0, self._build_secondary_tabs)
+
+    def _build_secondary_tabs(self) -> None:
+        """Build the History, Rules, Contacts and Settings tabs."""
+        from .views.history import HistoryView
+        from .views.rules import RulesView
+        from .views.contacts import ContactsView
+        from .views.settings import SettingsView
+        
+        with _paused_gc():
+            # History
+            self._history = HistoryView(
+                get_readings=self._get_chart_readings,
+                get_stats=self._get_chart_stats,
+            )
+            self._tabs.addTab(self._history, "History")
+            
+            # Rules
+            self._rules = RulesView(
+                config=self.config,
+                on_save=self._handle_save_settings,
+            )
+            self._tabs.addTab(self._rules, "Rules")
+            
+            # Contacts
+            self._contacts = ContactsView(
+                config=self.config,
+                on_save=self._handle_save_settings,
+                on_call=self._handle_call_contact,
+            )
+            self._tabs.addTab(self._contacts, "Contacts")
+            
+            # Settings
+            self._settings = SettingsView(
+                config=self.config,
+                on_save=self._handle_save_settings,
+                on_test_sound=self._handle_test_sound,
+            )
+            self._tabs.addTab(self._settings, "Settings")
+        
+        # Tab change handler
+        self._tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _get_chart_readings(self, hours: int) -> list:
+        """Readings for the history chart."""
+        return self.db.get_readings_for_chart(hours) if self.db else []
+
+    def _get_chart_stats(self, hours: int) -> dict:
+        """Stats for the history view."""
+        return self.db.get_stats(hours) if self.db else {}
 
     def _setup_tray(self) -> None:
         """Setup system tray."""
         self._tray = QSystemTrayIcon(self)
         
-        # Load icon from resources
-        from ..core.paths import get_resources_dir
-        icon_path = get_resources_dir() / "icons" / "bear-icon.png"
-        icon = QIcon(str(icon_path))
-        if icon.isNull():
-            icon = self.style().standardIcon(self.style().StandardPixmap.SP_ComputerIcon)
-        self._tray.setIcon(icon)
-        self.setWindowIcon(icon)
+        self._tray.setIcon(self._icon)
         
         # Tray menu
         menu = QMenu()
@@ -240,39 +323,64 @@ class BearAlarmApp(QMainWindow):
         self._tray.activated.connect(self._on_tray_activated)
         self._tray.show()
 
-    def _setup_timers(self) -> None:
-        """Setup periodic timers."""
-        # Volume check timer (every 2 seconds)
-        self._volume_timer = QTimer(self)
-        self._volume_timer.timeout.connect(self._check_volume)
-        self._volume_timer.start(2000)
-
     def _start_monitoring(self) -> None:
         """Start glucose monitoring thread."""
         if self._monitor_thread and self._monitor_thread.is_alive():
             return
         
         self._stop_monitoring.clear()
+        self._monitor_done = False
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
         logger.info("Monitoring started")
 
     def _monitor_loop(self) -> None:
+        """Monitor thread body; closes the database on the way out after shutdown."""
+        try:
+            self._poll_until_stopped()
+        finally:
+            with self._db_lock:
+                self._monitor_done = True
+            self._close_db_if_idle()
+
+    def _poll_until_stopped(self) -> None:
         """Main monitoring loop."""
+        self._check_volume()
+        
         # Initial delay
         if self.config and self.config.monitoring.startup_delay > 0:
             delay = self.config.monitoring.startup_delay
             logger.info(f"Startup delay: {delay}s")
-            self._stop_monitoring.wait(timeout=delay)
+            # Show a reading right away, but hold off alerting until the delay ends
+            self._submit_refresh(check_alerts=False)
+            if self._wait_checking_volume(delay):
+                return
         
-        while not self._stop_monitoring.is_set():
+        while True:
             self._fetch_glucose()
             
             poll_interval = self.config.monitoring.poll_interval if self.config else 300
-            self._stop_monitoring.wait(timeout=poll_interval)
+            if self._wait_checking_volume(poll_interval):
+                return
 
-    def _fetch_glucose(self) -> None:
-        """Fetch current glucose reading."""
+    def _wait_checking_volume(self, seconds: float) -> bool:
+        """
+        Wait until the next poll, checking volume every VOLUME_CHECK_INTERVAL.
+        
+        Returns:
+            True if monitoring was stopped during the wait
+        """
+        remaining = seconds
+        while remaining > 0:
+            step = min(VOLUME_CHECK_INTERVAL, remaining)
+            if self._stop_monitoring.wait(timeout=step):
+                return True
+            remaining -= step
+            self._check_volume()
+        return self._stop_monitoring.is_set()
+
+    def _fetch_glucose(self, check_alerts: bool = True) -> None:
+        """Fetch current glucose reading, optionally without checking thresholds."""
         if not self.dexcom_client:
             return
         
@@ -292,17 +400,8 @@ class BearAlarmApp(QMainWindow):
                 trend_arrow = trend_direction.arrow
             except (ValueError, Exception):
                 # Dexcom returns various trend descriptions, try to map them
-                trend_map = {
-                    "steady": "→", "flat": "→",
-                    "rising": "↗", "fortyFiveUp": "↗",
-                    "falling": "↘", "fortyFiveDown": "↘",
-                    "risingQuickly": "⬆", "singleUp": "⬆",
-                    "fallingQuickly": "⬇", "singleDown": "⬇",
-                    "risingRapidly": "⬆⬆", "doubleUp": "⬆⬆",
-                    "fallingRapidly": "⬇⬇", "doubleDown": "⬇⬇",
-                }
                 trend_desc = reading.trend_description.lower() if reading.trend_description else ""
-                trend_arrow = trend_map.get(trend_desc, "→")
+                trend_arrow = TREND_ARROWS.get(trend_desc, "→")
             
             self._current_glucose = glucose_mmol
             
@@ -319,7 +418,8 @@ class BearAlarmApp(QMainWindow):
             self._dashboard.update_glucose(glucose_mmol, trend_arrow, reading_time)
             
             # Check thresholds
-            self._check_thresholds(glucose_mmol)
+            if check_alerts:
+                self._check_thresholds(glucose_mmol)
             
             logger.info(f"Glucose: {glucose_mmol:.1f} mmol/L {trend_arrow}")
             
@@ -340,22 +440,34 @@ class BearAlarmApp(QMainWindow):
         low_persist = self.config.alerts.low_persist_minutes
         high_persist = self.config.alerts.high_persist_minutes
         
-        now = datetime.now()
+        now = time.monotonic()
         
         # Check snooze first - ALL alerts respect snooze (user has been informed)
-        if self._is_snoozed and self._snooze_until:
-            if now >= self._snooze_until:
-                self._is_snoozed = False
+        snooze_until = self._snooze_until_monotonic
+        if snooze_until:
+            if now >= snooze_until:
                 self._snooze_until = None
+                self._snooze_until_monotonic = 0.0
                 self._dashboard.update_snooze_state(None)
             else:
                 # Snoozed - no alerts
                 return
-        
+
+        # Fast path: in range with no persistence timers or alert to reset
+        if (
+            self._last_low_alert_start_time is None
+            and self._last_high_alert_start_time is None
+            and not self._alert_active
+            and urgent_low < glucose_mmol
+            and low < glucose_mmol < high
+        ):
+            return
+
         # Urgent low - immediate alert (no persistence timer)
         if glucose_mmol <= urgent_low:
             logger.critical(f"URGENT LOW: {glucose_mmol:.1f}")
             self.alert_system.trigger_low_alert()
+            self._alert_active = True
             self._last_low_alert_start_time = now
             self._last_high_alert_start_time = None
             return
@@ -365,12 +477,13 @@ class BearAlarmApp(QMainWindow):
             if self._last_low_alert_start_time is None:
                 self._last_low_alert_start_time = now
             
-            elapsed = (now - self._last_low_alert_start_time).total_seconds() / 60
+            elapsed = (now - self._last_low_alert_start_time) / 60
             if elapsed >= low_persist:
                 logger.warning(f"LOW (persistent): {glucose_mmol:.1f}")
                 self.alert_system.trigger_low_alert()
+                self._alert_active = True
             else:
-                self.alert_system.clear_alert()
+                self._clear_alert()
             self._last_high_alert_start_time = None
         
         # High glucose with persistence
@@ -378,31 +491,41 @@ class BearAlarmApp(QMainWindow):
             if self._last_high_alert_start_time is None:
                 self._last_high_alert_start_time = now
             
-            elapsed = (now - self._last_high_alert_start_time).total_seconds() / 60
+            elapsed = (now - self._last_high_alert_start_time) / 60
             if elapsed >= high_persist:
                 logger.warning(f"HIGH (persistent): {glucose_mmol:.1f}")
                 self.alert_system.trigger_high_alert()
+                self._alert_active = True
             else:
-                self.alert_system.clear_alert()
+                self._clear_alert()
             self._last_low_alert_start_time = None
         
         # Normal range
         else:
-            self.alert_system.clear_alert()
+            self._clear_alert()
             self._last_low_alert_start_time = None
             self._last_high_alert_start_time = None
 
+    def _clear_alert(self) -> None:
+        """Stop the active alert, only on the falling edge."""
+        if self._alert_active and self.alert_system:
+            self.alert_system.clear_alert()
+        self._alert_active = False
+
     def _check_volume(self) -> None:
-        """Check system volume."""
+        """Check system volume (runs on the monitor thread)."""
         if not self.config:
             return
         
         is_ok, message = check_volume_status(self.config.alerts.min_volume)
-        
-        if is_ok:
-            self._volume_warning.setText("")
-        else:
-            self._volume_warning.setText(f"⚠️ {message}")
+        text = "" if is_ok else f"⚠️ {message}"
+        if text != self._volume_text:
+            self._volume_text = text
+            self.signals.volume_status.emit(text)
+
+    def _on_volume_status(self, text: str) -> None:
+        """Show volume warning in the status bar."""
+        self._volume_warning.setText(text)
 
     def _on_tab_changed(self, index: int) -> None:
         """Handle tab change."""
@@ -412,23 +535,22 @@ class BearAlarmApp(QMainWindow):
             self._rules.refresh_ui()
         elif index == 3:  # Contacts
             self._contacts.refresh_ui()
+        elif index == 4:  # Settings
+            self._settings.ensure_built()
 
     def _handle_snooze(self, minutes: int) -> None:
         """Handle snooze request."""
-        self._is_snoozed = True
+        self._snooze_until_monotonic = time.monotonic() + minutes * 60
         self._snooze_until = datetime.now() + timedelta(minutes=minutes)
         self._dashboard.update_snooze_state(self._snooze_until)
         # Stop any currently playing alarm immediately
-        self.alert_system.clear_alert()
-        
-        if self.alert_system:
-            self.alert_system.clear_alert()
+        self._clear_alert()
         
         logger.info(f"Snoozed for {minutes} minutes")
 
     def _handle_cancel_snooze(self) -> None:
         """Cancel snooze."""
-        self._is_snoozed = False
+        self._snooze_until_monotonic = 0.0
         self._snooze_until = None
         self._dashboard.update_snooze_state(None)
         logger.info("Snooze cancelled")
@@ -452,13 +574,18 @@ class BearAlarmApp(QMainWindow):
                 else:
                     current[section] = values
             
-            # Save and reload
+            # Save and reload. The new Config is never mutated in place,
+            # so the worker can write it while the UI moves on.
+            previous = self.config
             self.config = Config(**current)
-            save_config(self.config)
+            self._save_pool.submit(self._write_config, self.config)
             
-            # Reinitialize components
-            self._init_dexcom()
-            self._init_alerts()
+            # Reinitialize only the components whose settings changed;
+            # threshold and schedule edits need neither
+            if previous is None or previous.dexcom != self.config.dexcom:
+                self._init_dexcom()
+            if previous is None or _alert_settings(previous) != _alert_settings(self.config):
+                self._init_alerts()
             
             # Update views
             self._settings.update_config(self.config)
@@ -474,6 +601,18 @@ class BearAlarmApp(QMainWindow):
             logger.error(f"Failed to save settings: {e}")
             QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
 
+    def _write_config(self, config: Config) -> None:
+        """Write config to disk (runs on the save worker)."""
+        try:
+            save_config(config)
+        except Exception as e:
+            logger.error(f"Failed to save settings: {e}")
+            self.signals.save_failed.emit(str(e))
+
+    def _on_save_failed(self, message: str) -> None:
+        """Tell the user a config write failed (queued from the save worker)."""
+        QMessageBox.critical(self, "Error", f"Failed to save settings: {message}")
+
     def _handle_test_sound(self, sound_path: str) -> None:
         """Test alert sound."""
         try:
@@ -485,7 +624,20 @@ class BearAlarmApp(QMainWindow):
 
     def _manual_refresh(self) -> None:
         """Manually refresh glucose."""
-        threading.Thread(target=self._fetch_glucose, daemon=True).start()
+        self._submit_refresh()
+
+    def _submit_refresh(self, check_alerts: bool = True) -> None:
+        """Fetch on the refresh pool, unless a fetch is in flight or we are shutting down."""
+        with self._db_lock:
+            if self._stop_monitoring.is_set():
+                return
+            if self._refresh_future and not self._refresh_future.done():
+                return  # Coalesce with the refresh already in flight
+            try:
+                self._refresh_future = self._refresh_pool.submit(self._fetch_glucose, check_alerts)
+            except RuntimeError:
+                # Pool already shut down - nothing left to show the reading to
+                pass
 
     def _show_window(self) -> None:
         """Show and raise window."""
@@ -516,17 +668,52 @@ class BearAlarmApp(QMainWindow):
 
     def _quit(self) -> None:
         """Clean shutdown."""
-        self._stop_monitoring.set()
+        self._shutdown()
+        self._tray.hide()
+        QApplication.quit()
+
+    def _shutdown(self) -> None:
+        """Stop background work and release resources (safe to call twice)."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        
+        # Under the lock so no refresh is submitted to the closing pool
+        with self._db_lock:
+            self._stop_monitoring.set()
+            self._refresh_pool.shutdown(wait=False, cancel_futures=True)
+        
+        # Hand debounced edits to the save pool before it closes
+        if hasattr(self, "_rules"):
+            self._rules.flush_pending_save()
+        if hasattr(self, "_contacts"):
+            self._contacts.flush_pending_save()
+        if hasattr(self, "_settings"):
+            self._settings.flush_pending_save()
+        # Let a pending config write finish so the last edit is not lost
+        self._save_pool.shutdown(wait=True)
         allow_sleep()
         
         if self.alert_system:
             self.alert_system.shutdown()
         
-        if self.db:
+        # Never block the UI thread on workers: whichever of the monitor
+        # thread or an in-flight fetch finishes last closes the database
+        if self._refresh_future:
+            self._refresh_future.add_done_callback(lambda _: self._close_db_if_idle())
+        self._close_db_if_idle()
+
+    def _close_db_if_idle(self) -> None:
+        """Close the database after shutdown, once no worker can still write to it."""
+        with self._db_lock:
+            if not self._shut_down or self.db is None:
+                return
+            if self._monitor_thread and not self._monitor_done:
+                return
+            if self._refresh_future and not self._refresh_future.done():
+                return
             self.db.close()
-        
-        self._tray.hide()
-        QApplication.quit()
+            self.db = None
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle window close - minimize to tray instead."""
@@ -554,6 +741,7 @@ def run() -> None:
     
     # Create and show window
     window = BearAlarmApp()
+    app.aboutToQuit.connect(window._shutdown)
     window.show()
     
     sys.exit(app.exec())
@@ -1,5 +1,7 @@
 """Theme - minimal, uses native system styling."""
 
+from dataclasses import dataclass
+
 from PySide6.QtWidgets import QApplication
 
 
@@ -12,11 +14,23 @@ def apply_theme(app: QApplication) -> None:
 STYLESHEET = ""
 
 
+@dataclass(frozen=True, slots=True)
+class _Colors:
+    """The few custom colors we use, all readable on light backgrounds."""
+
+    glucose_low: str = "#cc0000"  # Dark red
+    glucose_normal: str = "#006600"  # Dark green
+    glucose_high: str = "#cc6600"  # Dark orange
+    chart_line: str = "#007AFF"  # Apple blue
+
+
+COLORS = _Colors()
+
+
 def get_glucose_color(value: float, low: float = 3.9, high: float = 10.0) -> str:
     """Get color for glucose value - only place we use custom colors."""
     if value <= low:
-        return "#cc0000"  # Dark red - readable
+        return COLORS.glucose_low
     elif value >= high:
-        return "#cc6600"  # Dark orange - readable
-    return "#006600"  # Dark green - readable
-
+        return COLORS.glucose_high
+    return COLORS.glucose_normal
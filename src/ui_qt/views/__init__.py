@@ -1,11 +1,8 @@
 """Qt UI views."""
 
 from .dashboard import DashboardView
-from .history import HistoryView
-from .rules import RulesView
-from .contacts import ContactsView
-from .settings import SettingsView
-
-__all__ = ["DashboardView", "HistoryView", "RulesView", "ContactsView", "SettingsView"]
 
+# The other views are imported from their modules when their tabs are built,
+# keeping them off the startup path
 
+__all__ = ["DashboardView"]
@@ -1,8 +1,10 @@
 """Contacts view - emergency contacts management."""
 
+from dataclasses import dataclass
 from typing import Callable, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QScrollArea, QLineEdit, QCheckBox, QComboBox,
@@ -12,6 +14,147 @@ from PySide6.QtWidgets import (
 from ...core import Config, EmergencyContactConfig, call_facetime, send_imessage
 
 
+# Auto-message snooze choices: (minutes, label)
+LOW_SNOOZE_OPTIONS = ((15, "15 min"), (30, "30 min"), (60, "1 hour"), (120, "2 hours"), (240, "4 hours"))
+HIGH_SNOOZE_OPTIONS = ((30, "30 min"), (60, "1 hour"), (120, "2 hours"), (240, "4 hours"), (480, "8 hours"))
+LOW_SNOOZE_VALUES = tuple(minutes for minutes, _ in LOW_SNOOZE_OPTIONS)
+HIGH_SNOOZE_VALUES = tuple(minutes for minutes, _ in HIGH_SNOOZE_OPTIONS)
+
+# Dynamic property on card controls holding the card's key in ContactsView._cards
+CONTACT_KEY = "contactKey"
+
+
+@dataclass
+class _ContactCard:
+    """A contact's card widgets and the contact they were built for."""
+    contact: EmergencyContactConfig
+    frame: QFrame
+    name: QLabel
+    phone: QLabel
+    alerts: QLabel
+
+
+class ContactDialog(QDialog):
+    """Edit dialog for a single emergency contact."""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Contact")
+        self.setMinimumWidth(400)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(16)
+        
+        # Basic info
+        basic_group = QGroupBox("Contact Info")
+        basic_layout = QGridLayout(basic_group)
+        
+        basic_layout.addWidget(QLabel("Name:"), 0, 0)
+        self._name_edit = QLineEdit()
+        basic_layout.addWidget(self._name_edit, 0, 1)
+        
+        basic_layout.addWidget(QLabel("Phone:"), 1, 0)
+        self._phone_edit = QLineEdit()
+        self._phone_edit.setPlaceholderText("+1234567890")
+        basic_layout.addWidget(self._phone_edit, 1, 1)
+        
+        layout.addWidget(basic_group)
+        
+        # Low alert
+        low_group = QGroupBox("Low Glucose Alert")
+        low_layout = QVBoxLayout(low_group)
+        
+        self._low_enable = QCheckBox("Auto-message on low alert")
+        low_layout.addWidget(self._low_enable)
+        
+        # Snooze and message only shown while auto-message is on
+        self._low_details = QWidget()
+        low_details_layout = QVBoxLayout(self._low_details)
+        low_details_layout.setContentsMargins(0, 0, 0, 0)
+        self._low_enable.toggled.connect(self._low_details.setVisible)
+        low_layout.addWidget(self._low_details)
+        
+        low_snooze_layout = QHBoxLayout()
+        low_snooze_layout.addWidget(QLabel("Snooze:"))
+        self._low_snooze = QComboBox()
+        self._low_snooze.addItems([label for _, label in LOW_SNOOZE_OPTIONS])
+        low_snooze_layout.addWidget(self._low_snooze)
+        low_snooze_layout.addStretch()
+        low_details_layout.addLayout(low_snooze_layout)
+        
+        self._low_msg = QTextEdit()
+        self._low_msg.setMaximumHeight(60)
+        self._low_msg.setPlaceholderText("Message to send on low alert")
+        low_details_layout.addWidget(self._low_msg)
+        
+        layout.addWidget(low_group)
+        
+        # High alert
+        high_group = QGroupBox("High Glucose Alert")
+        high_layout = QVBoxLayout(high_group)
+        
+        self._high_enable = QCheckBox("Auto-message on high alert")
+        high_layout.addWidget(self._high_enable)
+        
+        self._high_details = QWidget()
+        high_details_layout = QVBoxLayout(self._high_details)
+        high_details_layout.setContentsMargins(0, 0, 0, 0)
+        self._high_enable.toggled.connect(self._high_details.setVisible)
+        high_layout.addWidget(self._high_details)
+        
+        high_snooze_layout = QHBoxLayout()
+        high_snooze_layout.addWidget(QLabel("Snooze:"))
+        self._high_snooze = QComboBox()
+        self._high_snooze.addItems([label for _, label in HIGH_SNOOZE_OPTIONS])
+        high_snooze_layout.addWidget(self._high_snooze)
+        high_snooze_layout.addStretch()
+        high_details_layout.addLayout(high_snooze_layout)
+        
+        self._high_msg = QTextEdit()
+        self._high_msg.setMaximumHeight(60)
+        self._high_msg.setPlaceholderText("Message to send on high alert")
+        high_details_layout.addWidget(self._high_msg)
+        
+        layout.addWidget(high_group)
+        
+        # Buttons
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def load(self, contact: EmergencyContactConfig) -> None:
+        """Fill the form from a contact."""
+        self._name_edit.setText(contact.name)
+        self._phone_edit.setText(contact.phone)
+        
+        self._low_enable.setChecked(contact.message_on_low)
+        values = LOW_SNOOZE_VALUES
+        self._low_snooze.setCurrentIndex(values.index(contact.message_on_low_snooze) if contact.message_on_low_snooze in values else 1)
+        self._low_msg.setPlainText(contact.low_message_text)
+        
+        self._high_enable.setChecked(contact.message_on_high)
+        values = HIGH_SNOOZE_VALUES
+        self._high_snooze.setCurrentIndex(values.index(contact.message_on_high_snooze) if contact.message_on_high_snooze in values else 1)
+        self._high_msg.setPlainText(contact.high_message_text)
+        
+        # toggled only fires on change, so sync the sections explicitly
+        self._low_details.setVisible(contact.message_on_low)
+        self._high_details.setVisible(contact.message_on_high)
+        self.adjustSize()
+
+    def apply(self, contact: EmergencyContactConfig, default_name: str) -> None:
+        """Write the form back to a contact."""
+        contact.name = self._name_edit.text() or default_name
+        contact.phone = self._phone_edit.text()
+        contact.message_on_low = self._low_enable.isChecked()
+        contact.message_on_low_snooze = LOW_SNOOZE_VALUES[self._low_snooze.currentIndex()]
+        contact.low_message_text = self._low_msg.toPlainText()
+        contact.message_on_high = self._high_enable.isChecked()
+        contact.message_on_high_snooze = HIGH_SNOOZE_VALUES[self._high_snooze.currentIndex()]
+        contact.high_message_text = self._high_msg.toPlainText()
+
+
 class ContactsView(QWidget):
     """Emergency contacts management."""
 
@@ -26,6 +169,18 @@ class ContactsView(QWidget):
         self.config = config
         self.on_save = on_save
         self.on_call = on_call
+        # id(contact) -> card, so unchanged contacts keep their widgets
+        self._cards: dict[int, _ContactCard] = {}
+        self._dialog: Optional[ContactDialog] = None
+        # Shared by every card's name label
+        self._name_font = QFont(self.font())
+        self._name_font.setBold(True)
+        
+        # Debounce save - coalesces quick toggles and edits into one write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._save)
+        
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -60,17 +215,37 @@ class ContactsView(QWidget):
         layout.addWidget(scroll)
 
     def _refresh_contacts(self) -> None:
-        """Refresh contact list."""
-        while self._contact_list.count():
-            item = self._contact_list.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        for i, contact in enumerate(self.config.alerts.emergency_contacts):
-            card = self._create_contact_card(contact, i)
-            self._contact_list.addWidget(card)
+        """Sync contact cards with config, building only cards for new contacts."""
+        contacts = self.config.alerts.emergency_contacts
+        
+        # Drop cards whose contact is gone
+        live = {id(contact) for contact in contacts}
+        for key in [key for key in self._cards if key not in live]:
+            self._drop_card(key)
+        
+        cards = [self._card_for(contact) for contact in contacts]
+        for i, card in enumerate(cards):
+            if self._contact_list.indexOf(card.frame) != i:
+                self._contact_list.removeWidget(card.frame)
+                self._contact_list.insertWidget(i, card.frame)
+
+    def _card_for(self, contact: EmergencyContactConfig) -> _ContactCard:
+        """Cached card for a contact, built on first use."""
+        # The card holds its contact, so the id cannot be reused while the card
+        # is cached; cards for removed contacts are dropped before this is called
+        card = self._cards.get(id(contact))
+        if card is None:
+            card = self._create_contact_card(contact)
+            self._cards[id(contact)] = card
+        return card
+
+    def _drop_card(self, key: int) -> None:
+        """Remove a cached card from the list."""
+        card = self._cards.pop(key)
+        self._contact_list.removeWidget(card.frame)
+        card.frame.deleteLater()
 
-    def _create_contact_card(self, contact: EmergencyContactConfig, index: int) -> QFrame:
+    def _create_contact_card(self, contact: EmergencyContactConfig) -> _ContactCard:
         """Create a contact card."""
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -83,52 +258,88 @@ class ContactsView(QWidget):
         
         enable_cb = QCheckBox()
         enable_cb.setChecked(contact.enabled)
-        enable_cb.stateChanged.connect(lambda state, i=index: self._toggle_contact(i, state == Qt.CheckState.Checked.value))
+        enable_cb.setProperty(CONTACT_KEY, id(contact))
+        enable_cb.toggled.connect(self._on_enabled_toggled)
         top.addWidget(enable_cb)
         
         info = QVBoxLayout()
         info.setSpacing(2)
         
-        name = QLabel(contact.name)
-        font = name.font()
-        font.setBold(True)
-        name.setFont(font)
-        name.setEnabled(contact.enabled)
+        name = QLabel()
+        name.setFont(self._name_font)
         info.addWidget(name)
         
-        phone = QLabel(contact.phone or "No phone")
+        phone = QLabel()
         phone.setEnabled(False)
         info.addWidget(phone)
         top.addLayout(info, 1)
         
         call_btn = QPushButton("Call")
         call_btn.setToolTip("FaceTime")
-        call_btn.clicked.connect(lambda: self.on_call(contact.phone))
+        call_btn.setProperty(CONTACT_KEY, id(contact))
+        call_btn.clicked.connect(self._on_call_clicked)
         top.addWidget(call_btn)
         
         edit_btn = QPushButton("Edit")
-        edit_btn.clicked.connect(lambda: self._edit_contact(index))
+        edit_btn.setProperty(CONTACT_KEY, id(contact))
+        edit_btn.clicked.connect(self._on_edit_clicked)
         top.addWidget(edit_btn)
         
         delete_btn = QPushButton("Delete")
-        delete_btn.clicked.connect(lambda: self._delete_contact(index))
+        delete_btn.setProperty(CONTACT_KEY, id(contact))
+        delete_btn.clicked.connect(self._on_delete_clicked)
         top.addWidget(delete_btn)
         
         layout.addLayout(top)
         
         # Alert settings summary
+        alerts_label = QLabel()
+        alerts_label.setEnabled(False)  # Grayed out secondary text
+        layout.addWidget(alerts_label)
+        
+        contact_card = _ContactCard(contact, card, name, phone, alerts_label)
+        self._update_card(contact_card)
+        return contact_card
+
+    def _update_card(self, card: _ContactCard) -> None:
+        """Refresh a card's labels from its contact."""
+        contact = card.contact
+        card.name.setText(contact.name)
+        card.name.setEnabled(contact.enabled)
+        card.phone.setText(contact.phone or "No phone")
+        
         alerts = []
         if contact.message_on_low:
             alerts.append(f"Low alert: {contact.message_on_low_snooze}min snooze")
         if contact.message_on_high:
             alerts.append(f"High alert: {contact.message_on_high_snooze}min snooze")
-        
-        if alerts:
-            alerts_label = QLabel(" • ".join(alerts))
-            alerts_label.setEnabled(False)  # Grayed out secondary text
-            layout.addWidget(alerts_label)
-        
-        return card
+        card.alerts.setText(" • ".join(alerts))
+        card.alerts.setVisible(bool(alerts))
+
+    def _sender_contact(self) -> Optional[EmergencyContactConfig]:
+        """Contact whose card the signal came from."""
+        card = self._cards.get(self.sender().property(CONTACT_KEY))
+        return card.contact if card else None
+
+    def _on_enabled_toggled(self, checked: bool) -> None:
+        contact = self._sender_contact()
+        if contact:
+            self._toggle_contact(contact, checked)
+
+    def _on_call_clicked(self) -> None:
+        contact = self._sender_contact()
+        if contact:
+            self.on_call(contact.phone)
+
+    def _on_edit_clicked(self) -> None:
+        contact = self._sender_contact()
+        if contact:
+            self._edit_contact(contact)
+
+    def _on_delete_clicked(self) -> None:
+        contact = self._sender_contact()
+        if contact:
+            self._delete_contact(contact)
 
     def _add_contact(self) -> None:
         """Add new contact."""
@@ -137,115 +348,52 @@ class ContactsView(QWidget):
         )
         self.config.alerts.emergency_contacts.append(new_contact)
         self._refresh_contacts()
-        self._edit_contact(len(self.config.alerts.emergency_contacts) - 1)
+        self._edit_contact(new_contact)
+
+    def _contact_index(self, contact: EmergencyContactConfig) -> int:
+        """Position of this exact contact - equal copies must not match each other."""
+        return next(i for i, c in enumerate(self.config.alerts.emergency_contacts) if c is contact)
 
-    def _edit_contact(self, index: int) -> None:
+    def _edit_contact(self, contact: EmergencyContactConfig) -> None:
         """Edit contact."""
-        contact = self.config.alerts.emergency_contacts[index]
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Edit Contact")
-        dialog.setMinimumWidth(400)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(16)
-        
-        # Basic info
-        basic_group = QGroupBox("Contact Info")
-        basic_layout = QGridLayout(basic_group)
-        
-        basic_layout.addWidget(QLabel("Name:"), 0, 0)
-        name_edit = QLineEdit(contact.name)
-        basic_layout.addWidget(name_edit, 0, 1)
-        
-        basic_layout.addWidget(QLabel("Phone:"), 1, 0)
-        phone_edit = QLineEdit(contact.phone)
-        phone_edit.setPlaceholderText("+1234567890")
-        basic_layout.addWidget(phone_edit, 1, 1)
-        
-        layout.addWidget(basic_group)
-        
-        # Low alert
-        low_group = QGroupBox("Low Glucose Alert")
-        low_layout = QVBoxLayout(low_group)
-        
-        low_enable = QCheckBox("Auto-message on low alert")
-        low_enable.setChecked(contact.message_on_low)
-        low_layout.addWidget(low_enable)
-        
-        low_snooze_layout = QHBoxLayout()
-        low_snooze_layout.addWidget(QLabel("Snooze:"))
-        low_snooze = QComboBox()
-        low_snooze.addItems(["15 min", "30 min", "1 hour", "2 hours", "4 hours"])
-        snooze_values = [15, 30, 60, 120, 240]
-        current_idx = snooze_values.index(contact.message_on_low_snooze) if contact.message_on_low_snooze in snooze_values else 1
-        low_snooze.setCurrentIndex(current_idx)
-        low_snooze_layout.addWidget(low_snooze)
-        low_snooze_layout.addStretch()
-        low_layout.addLayout(low_snooze_layout)
-        
-        low_msg = QTextEdit(contact.low_message_text)
-        low_msg.setMaximumHeight(60)
-        low_msg.setPlaceholderText("Message to send on low alert")
-        low_layout.addWidget(low_msg)
-        
-        layout.addWidget(low_group)
-        
-        # High alert
-        high_group = QGroupBox("High Glucose Alert")
-        high_layout = QVBoxLayout(high_group)
-        
-        high_enable = QCheckBox("Auto-message on high alert")
-        high_enable.setChecked(contact.message_on_high)
-        high_layout.addWidget(high_enable)
-        
-        high_snooze_layout = QHBoxLayout()
-        high_snooze_layout.addWidget(QLabel("Snooze:"))
-        high_snooze = QComboBox()
-        high_snooze.addItems(["30 min", "1 hour", "2 hours", "4 hours", "8 hours"])
-        snooze_values_high = [30, 60, 120, 240, 480]
-        current_idx_high = snooze_values_high.index(contact.message_on_high_snooze) if contact.message_on_high_snooze in snooze_values_high else 1
-        high_snooze.setCurrentIndex(current_idx_high)
-        high_snooze_layout.addWidget(high_snooze)
-        high_snooze_layout.addStretch()
-        high_layout.addLayout(high_snooze_layout)
-        
-        high_msg = QTextEdit(contact.high_message_text)
-        high_msg.setMaximumHeight(60)
-        high_msg.setPlaceholderText("Message to send on high alert")
-        high_layout.addWidget(high_msg)
-        
-        layout.addWidget(high_group)
-        
-        # Buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
-        
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            contact.name = name_edit.text() or f"Contact {index + 1}"
-            contact.phone = phone_edit.text()
-            contact.message_on_low = low_enable.isChecked()
-            contact.message_on_low_snooze = snooze_values[low_snooze.currentIndex()]
-            contact.low_message_text = low_msg.toPlainText()
-            contact.message_on_high = high_enable.isChecked()
-            contact.message_on_high_snooze = snooze_values_high[high_snooze.currentIndex()]
-            contact.high_message_text = high_msg.toPlainText()
-            self._refresh_contacts()
-            self._save()
+        index = self._contact_index(contact)
+        
+        # One dialog, built on first use and reloaded for each contact
+        if self._dialog is None:
+            self._dialog = ContactDialog(self)
+        self._dialog.load(contact)
+        
+        if self._dialog.exec() == QDialog.DialogCode.Accepted:
+            self._dialog.apply(contact, default_name=f"Contact {index + 1}")
+            card = self._cards.get(id(contact))
+            if card is not None:
+                self._update_card(card)
+            self._schedule_save()
 
-    def _toggle_contact(self, index: int, enabled: bool) -> None:
+    def _toggle_contact(self, contact: EmergencyContactConfig, enabled: bool) -> None:
         """Toggle contact enabled state."""
-        self.config.alerts.emergency_contacts[index].enabled = enabled
-        self._refresh_contacts()
-        self._save()
+        contact.enabled = enabled
+        # Checkbox already reflects the change, only the name needs updating
+        card = self._cards.get(id(contact))
+        if card is not None:
+            card.name.setEnabled(enabled)
+        self._schedule_save()
 
-    def _delete_contact(self, index: int) -> None:
+    def _delete_contact(self, contact: EmergencyContactConfig) -> None:
         """Delete contact."""
-        del self.config.alerts.emergency_contacts[index]
+        del self.config.alerts.emergency_contacts[self._contact_index(contact)]
         self._refresh_contacts()
-        self._save()
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule auto-save after a short delay."""
+        self._save_timer.start(500)
+
+    def flush_pending_save(self) -> None:
+        """Save now if a debounced save is still waiting, e.g. on quit."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save()
 
     def _save(self) -> None:
         """Save contacts."""
@@ -1,6 +1,6 @@
 """Dashboard view - main glucose display."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Callable, Optional
 
 from PySide6.QtCore import Qt, Signal, QObject
@@ -8,9 +8,19 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QGroupBox
 )
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QColor, QPalette
 
-from ..theme import get_glucose_color
+from ..theme import COLORS, get_glucose_color
+
+# QColor for each glucose color, built once rather than per reading
+_GLUCOSE_QCOLORS = {
+    color: QColor(color)
+    for color in (COLORS.glucose_low, COLORS.glucose_normal, COLORS.glucose_high)
+}
+
+
+# Snooze button choices: (minutes, label)
+SNOOZE_OPTIONS = ((15, "15m"), (30, "30m"), (60, "1h"), (120, "2h"))
 
 
 class DashboardSignals(QObject):
@@ -37,7 +47,12 @@ class DashboardView(QWidget):
         self.signals = DashboardSignals()
         
         self._current_glucose: Optional[float] = None
+        self._current_trend: Optional[str] = None
+        self._current_color: Optional[QColor] = None
+        self._current_timestamp: Optional[datetime] = None
+        self._updated_text = ""
         self._snooze_until: Optional[datetime] = None
+        self._contact_buttons: list[QPushButton] = []
         self._setup_ui()
         
         # Connect signals
@@ -92,9 +107,10 @@ class DashboardView(QWidget):
         snooze_layout = QHBoxLayout(snooze_group)
         snooze_layout.setSpacing(8)
         
-        for minutes, label in [(15, "15m"), (30, "30m"), (60, "1h"), (120, "2h")]:
+        for minutes, label in SNOOZE_OPTIONS:
             btn = QPushButton(label)
-            btn.clicked.connect(lambda checked, m=minutes: self.on_snooze(m))
+            btn.setProperty("minutes", minutes)
+            btn.clicked.connect(self._on_snooze_clicked)
             snooze_layout.addWidget(btn)
         
         layout.addWidget(snooze_group)
@@ -126,37 +142,65 @@ class DashboardView(QWidget):
         snooze_banner_layout.addWidget(self._snooze_label, 1)
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(lambda: self.on_cancel_snooze())
+        cancel_btn.clicked.connect(self.on_cancel_snooze)
         snooze_banner_layout.addWidget(cancel_btn)
         
         self._snooze_banner.hide()
         layout.addWidget(self._snooze_banner)
 
+    def _on_snooze_clicked(self) -> None:
+        self.on_snooze(self.sender().property("minutes"))
+
+    def _on_call_clicked(self) -> None:
+        self.on_call_contact(self.sender().property("phone"))
+
     def _on_glucose_updated(self, value: float, trend: str, timestamp: datetime) -> None:
         """Handle glucose update."""
-        self._current_glucose = value
-        self._glucose_label.setText(f"{value:.1f}")
-        self._trend_label.setText(trend)
-        
-        color = get_glucose_color(value)
-        self._glucose_label.setStyleSheet(f"color: {color};")
-        self._trend_label.setStyleSheet(f"color: {color};")
+        # Only touch value, trend and color labels when they change.
+        # Compare at display precision so sub-0.1 jitter is not redrawn.
+        displayed = round(value, 1)
+        if displayed != self._current_glucose:
+            self._current_glucose = displayed
+            self._glucose_label.setText(f"{value:.1f}")
+        
+        # Color follows the raw value, which can cross a threshold unseen
+        color = _GLUCOSE_QCOLORS[get_glucose_color(value)]
+        if color is not self._current_color:
+            self._current_color = color
+            self._set_text_color(self._glucose_label, color)
+            self._set_text_color(self._trend_label, color)
+        
+        if trend != self._current_trend:
+            self._current_trend = trend
+            self._trend_label.setText(trend)
         
         # Show age of reading
-        from datetime import timezone
         now = datetime.now(timezone.utc)
         reading_utc = timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
         age_minutes = (now - reading_utc).total_seconds() / 60
         
+        # Polls often return the same reading - only reformat times for a new one
+        if timestamp != self._current_timestamp:
+            self._current_timestamp = timestamp
+            self._updated_text = f"Updated {timestamp.strftime('%H:%M')}"
+            self._last_check_label.setText(f"Reading from: {timestamp.strftime('%H:%M:%S')}")
+        
         if age_minutes > 15:
             self._status_label.setText(f"⚠️ Data is {int(age_minutes)} min old!")
         else:
-            self._status_label.setText(f"Updated {timestamp.strftime('%H:%M')}")
-        
-        self._last_check_label.setText(f"Reading from: {timestamp.strftime('%H:%M:%S')}")
+            self._status_label.setText(self._updated_text)
+
+    @staticmethod
+    def _set_text_color(label: QLabel, color: QColor) -> None:
+        """Recolor a label via its palette, avoiding a stylesheet re-polish."""
+        palette = label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, color)
+        label.setPalette(palette)
 
     def _on_snooze_updated(self, until: Optional[datetime]) -> None:
         """Handle snooze state update."""
+        if until == self._snooze_until:
+            return  # Banner already shows this state
         self._snooze_until = until
         if until:
             self._snooze_label.setText(f"ALERTS SNOOZED UNTIL {until.strftime('%H:%M')}")
@@ -183,18 +227,25 @@ class DashboardView(QWidget):
 
     def update_contacts(self, contacts: list) -> None:
         """Update emergency contacts display."""
-        # Clear existing
-        while self._contacts_layout.count():
-            item = self._contacts_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        has_contacts = False
-        for contact in contacts:
-            if contact.enabled:
-                has_contacts = True
-                btn = QPushButton(f"Call {contact.name}")
-                btn.clicked.connect(lambda checked, phone=contact.phone: self.on_call_contact(phone))
-                self._contacts_layout.addWidget(btn)
-        
-        self._contacts_group.setVisible(has_contacts)
+        # Reuse the existing buttons by position; usually nothing changed.
+        # Contacts may share a phone, so every enabled contact gets its own button.
+        wanted = [(c.phone, c.name) for c in contacts if c.enabled]
+        while len(self._contact_buttons) > len(wanted):
+            btn = self._contact_buttons.pop()
+            self._contacts_layout.removeWidget(btn)
+            btn.deleteLater()
+        
+        for index, (phone, name) in enumerate(wanted):
+            if index < len(self._contact_buttons):
+                btn = self._contact_buttons[index]
+            else:
+                btn = QPushButton()
+                btn.clicked.connect(self._on_call_clicked)
+                self._contacts_layout.insertWidget(index, btn)
+                self._contact_buttons.append(btn)
+            btn.setProperty("phone", phone)
+            text = f"Call {name}"
+            if btn.text() != text:
+                btn.setText(text)
+        
+        self._contacts_group.setVisible(bool(wanted))
@@ -1,16 +1,78 @@
 """History view - glucose charts and statistics."""
 
+import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from PySide6.QtCore import Qt, QMargins
+from PySide6.QtCore import Qt, QMargins, QPointF, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QGridLayout, QButtonGroup
 )
-from PySide6.QtGui import QPainter, QColor, QPen
-from PySide6.QtCharts import QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis
+from PySide6.QtGui import QPainter, QColor, QFont, QPen
 
+from ..theme import COLORS
+
+if TYPE_CHECKING:
+    from PySide6.QtCharts import QChart
+
+logger = logging.getLogger(__name__)
+
+# Statistics grid: (stats key, title, value format)
+STATS_FIELDS = (
+    ("avg", "Average", "{:.1f}"),
+    ("min", "Lowest", "{:.1f}"),
+    ("max", "Highest", "{:.1f}"),
+    ("time_in_range", "In Range", "{:.0f}%"),
+)
+
+# Chart styling, built once at import
+CHART_LINE_COLOR = QColor(COLORS.chart_line)
+CHART_LINE_WIDTH = 2
+CHART_MARGINS = QMargins(10, 10, 10, 10)
+
+# Most points drawn on the chart; longer ranges are downsampled
+MAX_CHART_POINTS = 400
+
+
+@contextmanager
+def _updates_paused(widget: QWidget):
+    """Suspend repaints while several child widgets change, then repaint once."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _downsample(readings: list, max_points: int = MAX_CHART_POINTS) -> list:
+    """
+    Reduce readings to at most max_points, keeping each bucket's min and max.
+    
+    Keeping both extremes (in time order) preserves lows and highs that
+    plain striding would skip over.
+    """
+    if len(readings) <= max_points:
+        return readings
+    
+    # Integer bounds so the last bucket always ends at the newest reading
+    n = len(readings)
+    bucket_count = max_points // 2
+    reduced = []
+    for b in range(bucket_count):
+        bucket = readings[b * n // bucket_count:(b + 1) * n // bucket_count]
+        if not bucket:
+            continue
+        low = min(bucket, key=lambda r: r[1])
+        high = max(bucket, key=lambda r: r[1])
+        if low is high:
+            reduced.append(low)
+        elif low[0] <= high[0]:
+            reduced.extend((low, high))
+        else:
+            reduced.extend((high, low))
+    return reduced
 
 
 class HistoryView(QWidget):
@@ -26,6 +88,15 @@ class HistoryView(QWidget):
         self.get_readings = get_readings
         self.get_stats = get_stats
         self._selected_range = 6
+        self._chart: Optional["QChart"] = None
+        # (range, count, newest timestamp) of the data currently shown
+        self._data_key: Optional[tuple] = None
+        
+        # Debounce range changes - quick clicks through the ranges query once
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh_data)
+        
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -33,32 +104,64 @@ class HistoryView(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
         
-        # Time range selector
+        # Time range selector - each button's group id is its range in hours
         range_group = QButtonGroup(self)
         range_layout = QHBoxLayout()
         range_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self._range_buttons = {}
         for hours, label in [(3, "3h"), (6, "6h"), (12, "12h"), (24, "24h"), (72, "3d"), (168, "7d")]:
             btn = QPushButton(label)
             btn.setCheckable(True)
             btn.setChecked(hours == self._selected_range)
-            btn.clicked.connect(lambda checked, h=hours: self._select_range(h))
-            range_group.addButton(btn)
-            self._range_buttons[hours] = btn
+            range_group.addButton(btn, hours)
             range_layout.addWidget(btn)
+        range_group.idClicked.connect(self._select_range)
         
         layout.addLayout(range_layout)
         
-        # Chart
+        # Chart goes here once the tab is first shown, see ensure_built()
+        self._chart_layout = QVBoxLayout()
+        layout.addLayout(self._chart_layout)
+        
+        # Stats
+        stats_group = QGroupBox("Statistics")
+        stats_layout = QGridLayout(stats_group)
+        
+        value_font = QFont(self.font())
+        value_font.setPointSize(16)
+        value_font.setBold(True)
+        
+        self._stat_labels = {}
+        for i, (key, label, _) in enumerate(STATS_FIELDS):
+            title = QLabel(label)
+            title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            stats_layout.addWidget(title, 0, i)
+            
+            value = QLabel("—")
+            value.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            value.setFont(value_font)
+            self._stat_labels[key] = value
+            stats_layout.addWidget(value, 1, i)
+        
+        layout.addWidget(stats_group)
+        layout.addStretch()
+
+    def ensure_built(self) -> None:
+        """Build the chart on first use, keeping QtCharts off the startup path."""
+        if self._chart is not None:
+            return
+        
+        # QtCharts is a heavy import; nothing else needs it until the chart exists
+        from PySide6.QtCharts import QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis
+        
         self._chart = QChart()
         self._chart.legend().hide()
-        self._chart.setMargins(QMargins(10, 10, 10, 10))
+        self._chart.setMargins(CHART_MARGINS)
         
         self._series = QLineSeries()
-        self._series.setColor(QColor("#007AFF"))  # Apple blue
-        pen = QPen(QColor("#007AFF"))
-        pen.setWidth(2)
+        self._series.setColor(CHART_LINE_COLOR)
+        pen = QPen(CHART_LINE_COLOR)
+        pen.setWidth(CHART_LINE_WIDTH)
         self._series.setPen(pen)
         self._chart.addSeries(self._series)
         
@@ -77,68 +180,68 @@ class HistoryView(QWidget):
         chart_view = QChartView(self._chart)
         chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         chart_view.setMinimumHeight(250)
-        layout.addWidget(chart_view)
-        
-        # Stats
-        stats_group = QGroupBox("Statistics")
-        stats_layout = QGridLayout(stats_group)
-        
-        self._stat_labels = {}
-        for i, (key, label) in enumerate([("avg", "Average"), ("min", "Lowest"), ("max", "Highest"), ("in_range", "In Range")]):
-            title = QLabel(label)
-            title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            stats_layout.addWidget(title, 0, i)
-            
-            value = QLabel("—")
-            value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            font = value.font()
-            font.setPointSize(16)
-            font.setBold(True)
-            value.setFont(font)
-            self._stat_labels[key] = value
-            stats_layout.addWidget(value, 1, i)
-        
-        layout.addWidget(stats_group)
-        layout.addStretch()
+        self._chart_layout.addWidget(chart_view)
 
     def _select_range(self, hours: int) -> None:
         """Select time range."""
         if hours == self._selected_range:
             return
         
+        # The exclusive button group has already checked the clicked button
         self._selected_range = hours
-        for h, btn in self._range_buttons.items():
-            btn.setChecked(h == hours)
-        self.refresh_data()
+        self._refresh_timer.start(150)
+
+    def _slide_time_axis(self) -> None:
+        """Show the selected range ending now."""
+        max_time = datetime.now()
+        self._axis_x.setRange(max_time - timedelta(hours=self._selected_range), max_time)
 
     def refresh_data(self) -> None:
         """Refresh chart and stats."""
-        readings = self.get_readings(self._selected_range)
-        stats = self.get_stats(self._selected_range)
-        
-        self._series.clear()
-        if readings:
-            min_time = datetime.now() - timedelta(hours=self._selected_range)
-            max_time = datetime.now()
+        self.ensure_built()
+        try:
+            readings = self.get_readings(self._selected_range)
             
-            # Readings are tuples: (timestamp, glucose_mmol)
-            for ts, value in readings:
-                if isinstance(ts, str):
-                    ts = datetime.fromisoformat(ts)
-                self._series.append(ts.timestamp() * 1000, value)
+            # Skip redrawing (and the stats query) if nothing changed since last
+            # time, but keep the time window sliding so gaps in data show
+            data_key = (self._selected_range, len(readings), readings[-1][0] if readings else None)
+            if data_key == self._data_key:
+                if readings:
+                    self._slide_time_axis()
+                return
             
-            self._axis_x.setRange(min_time, max_time)
-            
-            values = [v for _, v in readings]
-            if values:
-                self._axis_y.setRange(max(0, min(values) - 1), max(values) + 1)
+            stats = self.get_stats(self._selected_range)
+        except Exception as e:
+            # Keep the last chart; the next refresh retries the query
+            logger.error(f"Failed to load history: {e}", exc_info=True)
+            return
+        self._data_key = data_key
         
-        if stats:
-            if stats.get("avg") is not None:
-                self._stat_labels["avg"].setText(f"{stats['avg']:.1f}")
-            if stats.get("min") is not None:
-                self._stat_labels["min"].setText(f"{stats['min']:.1f}")
-            if stats.get("max") is not None:
-                self._stat_labels["max"].setText(f"{stats['max']:.1f}")
-            if stats.get("time_in_range") is not None:
-                self._stat_labels["in_range"].setText(f"{stats['time_in_range']:.0f}%")
+        # One repaint for the series, axes and stat labels together
+        with _updates_paused(self):
+            if readings:
+                # Readings are tuples: (timestamp, glucose_mmol)
+                shown = _downsample(readings)
+                points = []
+                for ts, value in shown:
+                    if isinstance(ts, str):
+                        ts = datetime.fromisoformat(ts)
+                    points.append(QPointF(ts.timestamp() * 1000, value))
+                # Swap all points in one call instead of a signal per append
+                self._series.replace(points)
+                
+                self._slide_time_axis()
+                
+                # Downsampling keeps every bucket's extremes and its buckets cover
+                # every reading, so the reduced points have the same min and max
+                # as the full range (see tests/test_history.py)
+                values = [v for _, v in shown]
+                self._axis_y.setRange(max(0, min(values) - 1), max(values) + 1)
+            elif self._series.count():
+                # No data is common at startup - leave an already empty series alone
+                self._series.clear()
+            
+            # Missing stats reset to a dash rather than keeping the previous range's value
+            for key, _, fmt in STATS_FIELDS:
+                value = stats.get(key) if stats else None
+                self._stat_labels[key].setText(fmt.format(value) if value is not None else "—")
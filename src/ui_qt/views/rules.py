@@ -1,18 +1,172 @@
 """Rules view - alert thresholds and schedules."""
 
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Optional
 
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QScrollArea, QDoubleSpinBox, QSpinBox, QLineEdit,
-    QDialog, QDialogButtonBox, QCheckBox, QGridLayout, QGroupBox
+    QDialog, QDialogButtonBox, QCheckBox, QGridLayout, QGroupBox, QMessageBox
 )
 
 from ...core import Config, ScheduleConfig
 
 DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
+# Default threshold rows: (config.alerts field, label, spin box type, min, max, step, suffix, note)
+DEFAULT_FIELDS = (
+    ("low_threshold", "Low Threshold:", QDoubleSpinBox, 2.0, 5.0, 0.1, " mmol/L", None),
+    ("high_threshold", "High Threshold:", QDoubleSpinBox, 8.0, 20.0, 0.5, " mmol/L", None),
+    ("urgent_low", "Urgent Low:", QDoubleSpinBox, 1.5, 3.5, 0.1, " mmol/L", "(bypasses snooze)"),
+    ("low_persist_minutes", "Low Wait:", QSpinBox, 0, 30, 1, " min", None),
+    ("high_persist_minutes", "High Wait:", QSpinBox, 0, 60, 1, " min", None),
+)
+
+# Schedule start/end times, "H:MM" or "HH:MM" on a 24-hour clock
+TIME_RE = re.compile(r"([01]?\d|2[0-3]):[0-5]\d")
+
+# Dynamic property on default threshold inputs naming their config.alerts field
+ALERTS_FIELD = "alertsField"
+
+# Dynamic property on card controls holding the card's key in RulesView._cards
+SCHEDULE_KEY = "scheduleKey"
+
+
+@lru_cache(maxsize=128)
+def _days_text(days: tuple) -> str:
+    """Day names for a schedule's days, e.g. "Mon, Wed, Fri"."""
+    return ", ".join(DAY_NAMES[d] for d in sorted(days))
+
+
+@dataclass
+class _ScheduleCard:
+    """A schedule's card widgets and the schedule they were built for."""
+    schedule: ScheduleConfig
+    frame: QFrame
+    name: QLabel
+    details: QLabel
+
+
+class ScheduleDialog(QDialog):
+    """Edit dialog for a single alert schedule."""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Schedule")
+        self.setMinimumWidth(400)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(16)
+        
+        # Name
+        name_layout = QHBoxLayout()
+        name_layout.addWidget(QLabel("Name:"))
+        self._name_edit = QLineEdit()
+        name_layout.addWidget(self._name_edit)
+        layout.addLayout(name_layout)
+        
+        # Time
+        time_layout = QHBoxLayout()
+        time_layout.addWidget(QLabel("Time:"))
+        self._start_edit = QLineEdit()
+        self._start_edit.setPlaceholderText("09:00")
+        self._start_edit.setMaximumWidth(80)
+        time_layout.addWidget(self._start_edit)
+        time_layout.addWidget(QLabel("→"))
+        self._end_edit = QLineEdit()
+        self._end_edit.setPlaceholderText("17:00")
+        self._end_edit.setMaximumWidth(80)
+        time_layout.addWidget(self._end_edit)
+        time_layout.addStretch()
+        layout.addLayout(time_layout)
+        
+        # Days
+        days_layout = QHBoxLayout()
+        days_layout.addWidget(QLabel("Days:"))
+        self._day_checks = []
+        for name in DAY_NAMES:
+            cb = QCheckBox(name)
+            self._day_checks.append(cb)
+            days_layout.addWidget(cb)
+        layout.addLayout(days_layout)
+        
+        # Overrides
+        overrides_group = QGroupBox("Override Thresholds (leave empty for default)")
+        overrides_layout = QGridLayout(overrides_group)
+        
+        overrides_layout.addWidget(QLabel("Low:"), 0, 0)
+        self._low_edit = QDoubleSpinBox()
+        self._low_edit.setDecimals(1)
+        self._low_edit.setRange(0, 5.0)
+        self._low_edit.setSpecialValueText("—")
+        overrides_layout.addWidget(self._low_edit, 0, 1)
+        
+        overrides_layout.addWidget(QLabel("High:"), 0, 2)
+        self._high_edit = QDoubleSpinBox()
+        self._high_edit.setDecimals(1)
+        self._high_edit.setRange(0, 20.0)
+        self._high_edit.setSpecialValueText("—")
+        overrides_layout.addWidget(self._high_edit, 0, 3)
+        
+        overrides_layout.addWidget(QLabel("Low wait:"), 1, 0)
+        self._low_persist_edit = QSpinBox()
+        self._low_persist_edit.setRange(-1, 30)
+        self._low_persist_edit.setSpecialValueText("—")
+        overrides_layout.addWidget(self._low_persist_edit, 1, 1)
+        
+        overrides_layout.addWidget(QLabel("High wait:"), 1, 2)
+        self._high_persist_edit = QSpinBox()
+        self._high_persist_edit.setRange(-1, 60)
+        self._high_persist_edit.setSpecialValueText("—")
+        overrides_layout.addWidget(self._high_persist_edit, 1, 3)
+        
+        layout.addWidget(overrides_group)
+        
+        # Buttons
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def accept(self) -> None:
+        """Close only if both times parse, so a typo is never saved."""
+        for edit in (self._start_edit, self._end_edit):
+            text = edit.text().strip()
+            if text and not TIME_RE.fullmatch(text):
+                QMessageBox.warning(self, "Invalid Time", f'"{text}" is not a valid time. Use HH:MM, e.g. 09:00.')
+                edit.setFocus()
+                edit.selectAll()
+                return
+        super().accept()
+
+    def load(self, schedule: ScheduleConfig) -> None:
+        """Fill the form from a schedule."""
+        self._name_edit.setText(schedule.name)
+        self._start_edit.setText(schedule.start_time)
+        self._end_edit.setText(schedule.end_time)
+        days = frozenset(schedule.days)
+        for i, cb in enumerate(self._day_checks):
+            cb.setChecked(i in days)
+        self._low_edit.setValue(schedule.low_threshold or 0)
+        self._high_edit.setValue(schedule.high_threshold or 0)
+        self._low_persist_edit.setValue(schedule.low_persist_minutes if schedule.low_persist_minutes is not None else -1)
+        self._high_persist_edit.setValue(schedule.high_persist_minutes if schedule.high_persist_minutes is not None else -1)
+
+    def apply(self, schedule: ScheduleConfig, default_name: str) -> None:
+        """Write the form back to a schedule."""
+        schedule.name = self._name_edit.text() or default_name
+        # Empty times mean the whole day; accept() has rejected malformed ones
+        schedule.start_time = self._start_edit.text().strip() or "00:00"
+        schedule.end_time = self._end_edit.text().strip() or "23:59"
+        schedule.days = [i for i, cb in enumerate(self._day_checks) if cb.isChecked()]
+        schedule.low_threshold = self._low_edit.value() if self._low_edit.value() > 0 else None
+        schedule.high_threshold = self._high_edit.value() if self._high_edit.value() > 0 else None
+        schedule.low_persist_minutes = self._low_persist_edit.value() if self._low_persist_edit.value() >= 0 else None
+        schedule.high_persist_minutes = self._high_persist_edit.value() if self._high_persist_edit.value() >= 0 else None
+
 
 class RulesView(QWidget):
     """Alert rules and schedules configuration with auto-save."""
@@ -26,9 +180,12 @@ class RulesView(QWidget):
         super().__init__(parent)
         self.config = config
         self.on_save = on_save
+        # id(schedule) -> card, so unchanged schedules keep their widgets
+        self._cards: dict[int, _ScheduleCard] = {}
+        self._dialog: Optional[ScheduleDialog] = None
         
-        # Debounce timer for auto-save
-        self._save_timer = QTimer()
+        # Debounce save - coalesces threshold edits and schedule changes into one write
+        self._save_timer = QTimer(self)
         self._save_timer.setSingleShot(True)
         self._save_timer.timeout.connect(self._save)
         
@@ -54,61 +211,27 @@ class RulesView(QWidget):
         defaults_layout.setSpacing(8)
         defaults_layout.setColumnMinimumWidth(0, 100)  # Label column
         
-        row = 0
-        
-        # Low threshold
-        defaults_layout.addWidget(QLabel("Low Threshold:"), row, 0)
-        self._low_spin = QDoubleSpinBox()
-        self._low_spin.setRange(2.0, 5.0)
-        self._low_spin.setSingleStep(0.1)
-        self._low_spin.setValue(self.config.alerts.low_threshold)
-        self._low_spin.setSuffix(" mmol/L")
-        defaults_layout.addWidget(self._low_spin, row, 1)
-        row += 1
-        
-        # High threshold
-        defaults_layout.addWidget(QLabel("High Threshold:"), row, 0)
-        self._high_spin = QDoubleSpinBox()
-        self._high_spin.setRange(8.0, 20.0)
-        self._high_spin.setSingleStep(0.5)
-        self._high_spin.setValue(self.config.alerts.high_threshold)
-        self._high_spin.setSuffix(" mmol/L")
-        defaults_layout.addWidget(self._high_spin, row, 1)
-        row += 1
-        
-        # Urgent low
-        defaults_layout.addWidget(QLabel("Urgent Low:"), row, 0)
-        self._urgent_spin = QDoubleSpinBox()
-        self._urgent_spin.setRange(1.5, 3.5)
-        self._urgent_spin.setSingleStep(0.1)
-        self._urgent_spin.setValue(self.config.alerts.urgent_low)
-        self._urgent_spin.setSuffix(" mmol/L")
-        defaults_layout.addWidget(self._urgent_spin, row, 1)
-        urgent_note = QLabel("(bypasses snooze)")
-        urgent_note.setEnabled(False)
-        defaults_layout.addWidget(urgent_note, row, 2)
-        row += 1
-        
-        # Persistence timers
-        defaults_layout.addWidget(QLabel("Low Wait:"), row, 0)
-        self._low_persist = QSpinBox()
-        self._low_persist.setRange(0, 30)
-        self._low_persist.setValue(self.config.alerts.low_persist_minutes)
-        self._low_persist.setSuffix(" min")
-        defaults_layout.addWidget(self._low_persist, row, 1)
-        row += 1
-        
-        defaults_layout.addWidget(QLabel("High Wait:"), row, 0)
-        self._high_persist = QSpinBox()
-        self._high_persist.setRange(0, 60)
-        self._high_persist.setValue(self.config.alerts.high_persist_minutes)
-        self._high_persist.setSuffix(" min")
-        defaults_layout.addWidget(self._high_persist, row, 1)
-        row += 1
+        # Default threshold inputs, keyed by their config.alerts field
+        self._default_spins = {}
+        for row, (field, label, spin_type, minimum, maximum, step, suffix, note) in enumerate(DEFAULT_FIELDS):
+            defaults_layout.addWidget(QLabel(label), row, 0)
+            spin = spin_type()
+            if spin_type is QDoubleSpinBox:
+                spin.setDecimals(1)  # mmol/L is shown to one decimal everywhere
+            spin.setRange(minimum, maximum)
+            spin.setSingleStep(step)
+            spin.setValue(getattr(self.config.alerts, field))
+            spin.setSuffix(suffix)
+            defaults_layout.addWidget(spin, row, 1)
+            self._default_spins[field] = spin
+            if note:
+                note_label = QLabel(note)
+                note_label.setEnabled(False)
+                defaults_layout.addWidget(note_label, row, 2)
         
         persist_note = QLabel("Wait time before alerting (0 = immediate)")
         persist_note.setEnabled(False)
-        defaults_layout.addWidget(persist_note, row, 0, 1, 3)
+        defaults_layout.addWidget(persist_note, len(DEFAULT_FIELDS), 0, 1, 3)
         
         content_layout.addWidget(defaults_group)
         
@@ -138,30 +261,57 @@ class RulesView(QWidget):
         layout.addWidget(scroll)
         
         # Connect inputs to auto-save
-        self._low_spin.valueChanged.connect(self._schedule_save)
-        self._high_spin.valueChanged.connect(self._schedule_save)
-        self._urgent_spin.valueChanged.connect(self._schedule_save)
-        self._low_persist.valueChanged.connect(self._schedule_save)
-        self._high_persist.valueChanged.connect(self._schedule_save)
+        for field, spin in self._default_spins.items():
+            spin.setProperty(ALERTS_FIELD, field)
+            spin.valueChanged.connect(self._on_default_changed)
     
+    def _on_default_changed(self, value) -> None:
+        """Write an edited default straight to config, then save shortly."""
+        setattr(self.config.alerts, self.sender().property(ALERTS_FIELD), value)
+        self._schedule_save()
+
     def _schedule_save(self) -> None:
         """Schedule auto-save after a short delay."""
         self._save_timer.start(500)
 
+    def flush_pending_save(self) -> None:
+        """Save now if a debounced save is still waiting, e.g. on quit."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save()
+
     def _refresh_schedules(self) -> None:
-        """Refresh schedule list."""
-        # Clear existing
-        while self._schedule_list.count():
-            item = self._schedule_list.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add schedule cards
-        for i, schedule in enumerate(self.config.alerts.schedules):
-            card = self._create_schedule_card(schedule, i)
-            self._schedule_list.addWidget(card)
-
-    def _create_schedule_card(self, schedule: ScheduleConfig, index: int) -> QFrame:
+        """Sync schedule cards with config, building only cards for new schedules."""
+        schedules = self.config.alerts.schedules
+        
+        # Drop cards whose schedule is gone
+        live = {id(schedule) for schedule in schedules}
+        for key in [key for key in self._cards if key not in live]:
+            self._drop_card(key)
+        
+        cards = [self._card_for(schedule) for schedule in schedules]
+        for i, card in enumerate(cards):
+            if self._schedule_list.indexOf(card.frame) != i:
+                self._schedule_list.removeWidget(card.frame)
+                self._schedule_list.insertWidget(i, card.frame)
+
+    def _card_for(self, schedule: ScheduleConfig) -> _ScheduleCard:
+        """Cached card for a schedule, built on first use."""
+        # The card holds its schedule, so the id cannot be reused while the card
+        # is cached; cards for removed schedules are dropped before this is called
+        card = self._cards.get(id(schedule))
+        if card is None:
+            card = self._create_schedule_card(schedule)
+            self._cards[id(schedule)] = card
+        return card
+
+    def _drop_card(self, key: int) -> None:
+        """Remove a cached card from the list."""
+        card = self._cards.pop(key)
+        self._schedule_list.removeWidget(card.frame)
+        card.frame.deleteLater()
+
+    def _create_schedule_card(self, schedule: ScheduleConfig) -> _ScheduleCard:
         """Create a schedule card widget."""
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -171,12 +321,10 @@ class RulesView(QWidget):
         # Info
         info_layout = QVBoxLayout()
         
-        name_label = QLabel(schedule.name)
+        name_label = QLabel()
         info_layout.addWidget(name_label)
         
-        days_str = ", ".join(DAY_NAMES[d] for d in sorted(schedule.days))
-        time_str = f"{schedule.start_time} - {schedule.end_time}"
-        details = QLabel(f"{days_str} • {time_str}")
+        details = QLabel()
         details.setEnabled(False)
         info_layout.addWidget(details)
         
@@ -184,14 +332,42 @@ class RulesView(QWidget):
         
         # Buttons
         edit_btn = QPushButton("Edit")
-        edit_btn.clicked.connect(lambda: self._edit_schedule(index))
+        edit_btn.setProperty(SCHEDULE_KEY, id(schedule))
+        edit_btn.clicked.connect(self._on_edit_clicked)
         layout.addWidget(edit_btn)
         
         delete_btn = QPushButton("Delete")
-        delete_btn.clicked.connect(lambda: self._delete_schedule(index))
+        delete_btn.setProperty(SCHEDULE_KEY, id(schedule))
+        delete_btn.clicked.connect(self._on_delete_clicked)
         layout.addWidget(delete_btn)
         
-        return card
+        schedule_card = _ScheduleCard(schedule, card, name_label, details)
+        self._update_card(schedule_card)
+        return schedule_card
+
+    def _update_card(self, card: _ScheduleCard) -> None:
+        """Refresh a card's labels from its schedule."""
+        schedule = card.schedule
+        card.name.setText(schedule.name)
+        
+        days_str = _days_text(tuple(schedule.days))
+        time_str = f"{schedule.start_time} - {schedule.end_time}"
+        card.details.setText(f"{days_str} • {time_str}")
+
+    def _sender_schedule(self) -> Optional[ScheduleConfig]:
+        """Schedule whose card the signal came from."""
+        card = self._cards.get(self.sender().property(SCHEDULE_KEY))
+        return card.schedule if card else None
+
+    def _on_edit_clicked(self) -> None:
+        schedule = self._sender_schedule()
+        if schedule:
+            self._edit_schedule(schedule)
+
+    def _on_delete_clicked(self) -> None:
+        schedule = self._sender_schedule()
+        if schedule:
+            self._delete_schedule(schedule)
 
     def _add_schedule(self) -> None:
         """Add a new schedule."""
@@ -201,126 +377,48 @@ class RulesView(QWidget):
         )
         self.config.alerts.schedules.append(new_schedule)
         self._refresh_schedules()
-        self._edit_schedule(len(self.config.alerts.schedules) - 1)
+        # Let the new card paint before the modal dialog blocks the view
+        QTimer.singleShot(0, lambda: self._edit_schedule(new_schedule))
+
+    def _schedule_index(self, schedule: ScheduleConfig) -> int:
+        """Position of this exact schedule - equal copies must not match each other."""
+        return next(i for i, s in enumerate(self.config.alerts.schedules) if s is schedule)
 
-    def _edit_schedule(self, index: int) -> None:
+    def _edit_schedule(self, schedule: ScheduleConfig) -> None:
         """Edit a schedule."""
-        schedule = self.config.alerts.schedules[index]
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Edit Schedule")
-        dialog.setMinimumWidth(400)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(16)
-        
-        # Name
-        name_layout = QHBoxLayout()
-        name_layout.addWidget(QLabel("Name:"))
-        name_edit = QLineEdit(schedule.name)
-        name_layout.addWidget(name_edit)
-        layout.addLayout(name_layout)
-        
-        # Time
-        time_layout = QHBoxLayout()
-        time_layout.addWidget(QLabel("Time:"))
-        start_edit = QLineEdit(schedule.start_time)
-        start_edit.setPlaceholderText("09:00")
-        start_edit.setMaximumWidth(80)
-        time_layout.addWidget(start_edit)
-        time_layout.addWidget(QLabel("→"))
-        end_edit = QLineEdit(schedule.end_time)
-        end_edit.setPlaceholderText("17:00")
-        end_edit.setMaximumWidth(80)
-        time_layout.addWidget(end_edit)
-        time_layout.addStretch()
-        layout.addLayout(time_layout)
-        
-        # Days
-        days_layout = QHBoxLayout()
-        days_layout.addWidget(QLabel("Days:"))
-        day_checks = []
-        for i, name in enumerate(DAY_NAMES):
-            cb = QCheckBox(name)
-            cb.setChecked(i in schedule.days)
-            day_checks.append(cb)
-            days_layout.addWidget(cb)
-        layout.addLayout(days_layout)
-        
-        # Overrides
-        overrides_group = QGroupBox("Override Thresholds (leave empty for default)")
-        overrides_layout = QGridLayout(overrides_group)
-        
-        overrides_layout.addWidget(QLabel("Low:"), 0, 0)
-        low_edit = QDoubleSpinBox()
-        low_edit.setRange(0, 5.0)
-        low_edit.setSpecialValueText("—")
-        low_edit.setValue(schedule.low_threshold or 0)
-        overrides_layout.addWidget(low_edit, 0, 1)
-        
-        overrides_layout.addWidget(QLabel("High:"), 0, 2)
-        high_edit = QDoubleSpinBox()
-        high_edit.setRange(0, 20.0)
-        high_edit.setSpecialValueText("—")
-        high_edit.setValue(schedule.high_threshold or 0)
-        overrides_layout.addWidget(high_edit, 0, 3)
-        
-        overrides_layout.addWidget(QLabel("Low wait:"), 1, 0)
-        low_persist_edit = QSpinBox()
-        low_persist_edit.setRange(-1, 30)
-        low_persist_edit.setSpecialValueText("—")
-        low_persist_edit.setValue(schedule.low_persist_minutes if schedule.low_persist_minutes is not None else -1)
-        overrides_layout.addWidget(low_persist_edit, 1, 1)
-        
-        overrides_layout.addWidget(QLabel("High wait:"), 1, 2)
-        high_persist_edit = QSpinBox()
-        high_persist_edit.setRange(-1, 60)
-        high_persist_edit.setSpecialValueText("—")
-        high_persist_edit.setValue(schedule.high_persist_minutes if schedule.high_persist_minutes is not None else -1)
-        overrides_layout.addWidget(high_persist_edit, 1, 3)
-        
-        layout.addWidget(overrides_group)
-        
-        # Buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
-        
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            schedule.name = name_edit.text() or f"Schedule {index + 1}"
-            schedule.start_time = start_edit.text() or "00:00"
-            schedule.end_time = end_edit.text() or "23:59"
-            schedule.days = [i for i, cb in enumerate(day_checks) if cb.isChecked()]
-            schedule.low_threshold = low_edit.value() if low_edit.value() > 0 else None
-            schedule.high_threshold = high_edit.value() if high_edit.value() > 0 else None
-            schedule.low_persist_minutes = low_persist_edit.value() if low_persist_edit.value() >= 0 else None
-            schedule.high_persist_minutes = high_persist_edit.value() if high_persist_edit.value() >= 0 else None
-            self._refresh_schedules()
-            self._save()
+        index = self._schedule_index(schedule)
+        
+        # One dialog, built on first use and reloaded for each schedule
+        if self._dialog is None:
+            self._dialog = ScheduleDialog(self)
+        self._dialog.load(schedule)
+        
+        if self._dialog.exec() == QDialog.DialogCode.Accepted:
+            self._dialog.apply(schedule, default_name=f"Schedule {index + 1}")
+            card = self._cards.get(id(schedule))
+            if card is not None:
+                self._update_card(card)
+            self._schedule_save()
 
-    def _delete_schedule(self, index: int) -> None:
+    def _delete_schedule(self, schedule: ScheduleConfig) -> None:
         """Delete a schedule."""
-        del self.config.alerts.schedules[index]
+        del self.config.alerts.schedules[self._schedule_index(schedule)]
         self._refresh_schedules()
-        self._save()
+        self._schedule_save()
 
     def _save(self) -> None:
         """Save rules."""
-        self.config.alerts.low_threshold = self._low_spin.value()
-        self.config.alerts.high_threshold = self._high_spin.value()
-        self.config.alerts.urgent_low = self._urgent_spin.value()
-        self.config.alerts.low_persist_minutes = self._low_persist.value()
-        self.config.alerts.high_persist_minutes = self._high_persist.value()
-        
         self.on_save(self.config.model_dump())
 
     def refresh_ui(self) -> None:
         """Refresh UI with current config."""
-        self._low_spin.setValue(self.config.alerts.low_threshold)
-        self._high_spin.setValue(self.config.alerts.high_threshold)
-        self._urgent_spin.setValue(self.config.alerts.urgent_low)
-        self._low_persist.setValue(self.config.alerts.low_persist_minutes)
-        self._high_persist.setValue(self.config.alerts.high_persist_minutes)
+        # Write into the existing inputs; signals are blocked so showing
+        # the tab does not look like an edit and trigger a save
+        for field, spin in self._default_spins.items():
+            value = getattr(self.config.alerts, field)
+            if spin.value() != value:
+                spin.blockSignals(True)
+                spin.setValue(value)
+                spin.blockSignals(False)
         self._refresh_schedules()
 
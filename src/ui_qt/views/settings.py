@@ -12,6 +12,13 @@ from PySide6.QtWidgets import (
 
 from ...core import Config
 
+# Dexcom Share regions: (config code, label), in combo box order
+REGIONS = (("us", "United States"), ("ous", "Outside US"), ("jp", "Japan"))
+REGION_INDEX = {code: i for i, (code, _) in enumerate(REGIONS)}
+
+# Dynamic property on sound row buttons naming their sound slot ("low" or "high")
+SOUND_TYPE = "soundType"
+
 
 class SettingsView(QWidget):
     """Application settings with auto-save."""
@@ -29,10 +36,18 @@ class SettingsView(QWidget):
         self.on_test_sound = on_test_sound
         
         # Debounce timer for auto-save (saves 500ms after last change)
-        self._save_timer = QTimer()
+        self._save_timer = QTimer(self)
         self._save_timer.setSingleShot(True)
         self._save_timer.timeout.connect(self._save)
         
+        # Form is built on first visit to the tab, see ensure_built()
+        self._built = False
+
+    def ensure_built(self) -> None:
+        """Build the form on first use, from the current config."""
+        if self._built:
+            return
+        self._built = True
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -66,9 +81,8 @@ class SettingsView(QWidget):
         
         dexcom_layout.addWidget(QLabel("Region:"), 2, 0)
         self._region = QComboBox()
-        self._region.addItems(["United States", "Outside US", "Japan"])
-        region_index = {"us": 0, "ous": 1, "jp": 2}.get(self.config.dexcom.region, 0)
-        self._region.setCurrentIndex(region_index)
+        self._region.addItems([label for _, label in REGIONS])
+        self._region.setCurrentIndex(REGION_INDEX.get(self.config.dexcom.region, 0))
         dexcom_layout.addWidget(self._region, 2, 1)
         
         content_layout.addWidget(dexcom_group)
@@ -81,62 +95,57 @@ class SettingsView(QWidget):
         # Low sound
         low_sound_layout = QHBoxLayout()
         low_sound_layout.addWidget(QLabel("Low Alert:"))
-        self._low_sound_label = QLabel(Path(self.config.alerts.low_alert_sound).name)
-        self._low_sound_label.setEnabled(False)
-        low_sound_layout.addWidget(self._low_sound_label, 1)
+        low_sound_label = QLabel(Path(self.config.alerts.low_alert_sound).name)
+        low_sound_label.setEnabled(False)
+        low_sound_layout.addWidget(low_sound_label, 1)
         
         low_browse = QPushButton("Browse")
-        low_browse.clicked.connect(lambda: self._browse_sound("low"))
+        low_browse.setProperty(SOUND_TYPE, "low")
+        low_browse.clicked.connect(self._on_browse_clicked)
         low_sound_layout.addWidget(low_browse)
         
         low_test = QPushButton("▶")
         low_test.setMaximumWidth(40)
-        low_test.clicked.connect(lambda: self.on_test_sound(self._low_sound_path))
+        low_test.setProperty(SOUND_TYPE, "low")
+        low_test.clicked.connect(self._on_test_clicked)
         low_sound_layout.addWidget(low_test)
         
-        self._low_sound_path = self.config.alerts.low_alert_sound
         sounds_layout.addLayout(low_sound_layout)
         
         # High sound
         high_sound_layout = QHBoxLayout()
         high_sound_layout.addWidget(QLabel("High Alert:"))
-        self._high_sound_label = QLabel(Path(self.config.alerts.high_alert_sound).name)
-        self._high_sound_label.setEnabled(False)
-        high_sound_layout.addWidget(self._high_sound_label, 1)
+        high_sound_label = QLabel(Path(self.config.alerts.high_alert_sound).name)
+        high_sound_label.setEnabled(False)
+        high_sound_layout.addWidget(high_sound_label, 1)
         
         high_browse = QPushButton("Browse")
-        high_browse.clicked.connect(lambda: self._browse_sound("high"))
+        high_browse.setProperty(SOUND_TYPE, "high")
+        high_browse.clicked.connect(self._on_browse_clicked)
         high_sound_layout.addWidget(high_browse)
         
         high_test = QPushButton("▶")
         high_test.setMaximumWidth(40)
-        high_test.clicked.connect(lambda: self.on_test_sound(self._high_sound_path))
+        high_test.setProperty(SOUND_TYPE, "high")
+        high_test.clicked.connect(self._on_test_clicked)
         high_sound_layout.addWidget(high_test)
         
-        self._high_sound_path = self.config.alerts.high_alert_sound
         sounds_layout.addLayout(high_sound_layout)
         
-        # Alert repeat count
-        repeat_layout = QHBoxLayout()
-        repeat_layout.addWidget(QLabel("Play Sound:"))
-        self._repeat_spin = QSpinBox()
-        self._repeat_spin.setRange(1, 5)
-        self._repeat_spin.setValue(self.config.alerts.alert_repeat_count)
-        self._repeat_spin.setSuffix(" time(s)")
-        repeat_layout.addWidget(self._repeat_spin)
-        repeat_layout.addStretch()
-        sounds_layout.addLayout(repeat_layout)
+        # Sound slots by type, so one browse path serves both
+        self._sound_paths = {
+            "low": self.config.alerts.low_alert_sound,
+            "high": self.config.alerts.high_alert_sound,
+        }
+        self._sound_labels = {"low": low_sound_label, "high": high_sound_label}
         
-        # Alert interval
-        interval_layout = QHBoxLayout()
-        interval_layout.addWidget(QLabel("Repeat Interval:"))
-        self._interval_spin = QSpinBox()
-        self._interval_spin.setRange(1, 30)
-        self._interval_spin.setValue(self.config.alerts.alert_interval // 60)
-        self._interval_spin.setSuffix(" min")
-        interval_layout.addWidget(self._interval_spin)
-        interval_layout.addStretch()
-        sounds_layout.addLayout(interval_layout)
+        # Alert repeat count and interval
+        self._repeat_spin = self._add_spin_row(
+            sounds_layout, "Play Sound:", 1, 5, self.config.alerts.alert_repeat_count, " time(s)"
+        )
+        self._interval_spin = self._add_spin_row(
+            sounds_layout, "Repeat Interval:", 1, 30, self.config.alerts.alert_interval // 60, " min"
+        )
         
         content_layout.addWidget(sounds_group)
         
@@ -145,27 +154,13 @@ class SettingsView(QWidget):
         monitor_layout = QVBoxLayout(monitor_group)
         monitor_layout.setSpacing(12)
         
-        # Poll interval
-        poll_layout = QHBoxLayout()
-        poll_layout.addWidget(QLabel("Check Interval:"))
-        self._poll_spin = QSpinBox()
-        self._poll_spin.setRange(1, 15)
-        self._poll_spin.setValue(self.config.monitoring.poll_interval // 60)
-        self._poll_spin.setSuffix(" min")
-        poll_layout.addWidget(self._poll_spin)
-        poll_layout.addStretch()
-        monitor_layout.addLayout(poll_layout)
-        
-        # Startup delay
-        delay_layout = QHBoxLayout()
-        delay_layout.addWidget(QLabel("Startup Delay:"))
-        self._delay_spin = QSpinBox()
-        self._delay_spin.setRange(0, 60)
-        self._delay_spin.setValue(self.config.monitoring.startup_delay_minutes)
-        self._delay_spin.setSuffix(" min")
-        delay_layout.addWidget(self._delay_spin)
-        delay_layout.addStretch()
-        monitor_layout.addLayout(delay_layout)
+        # Poll interval and startup delay
+        self._poll_spin = self._add_spin_row(
+            monitor_layout, "Check Interval:", 1, 15, self.config.monitoring.poll_interval // 60, " min"
+        )
+        self._delay_spin = self._add_spin_row(
+            monitor_layout, "Startup Delay:", 0, 60, self.config.monitoring.startup_delay_minutes, " min"
+        )
         
         # Volume warning
         volume_layout = QHBoxLayout()
@@ -174,10 +169,14 @@ class SettingsView(QWidget):
         self._volume_slider.setRange(10, 100)
         self._volume_slider.setValue(self.config.alerts.min_volume)
         self._volume_slider.setTickInterval(10)
+        # Only commit the value (and schedule a save) on release; the label
+        # still follows the handle while dragging
+        self._volume_slider.setTracking(False)
         volume_layout.addWidget(self._volume_slider)
         self._volume_label = QLabel(f"{self.config.alerts.min_volume}%")
         self._volume_label.setMinimumWidth(40)
-        self._volume_slider.valueChanged.connect(lambda v: self._volume_label.setText(f"{v}%"))
+        self._volume_slider.sliderMoved.connect(self._update_volume_label)
+        self._volume_slider.valueChanged.connect(self._update_volume_label)
         volume_layout.addWidget(self._volume_label)
         monitor_layout.addLayout(volume_layout)
         
@@ -197,10 +196,42 @@ class SettingsView(QWidget):
         self._delay_spin.valueChanged.connect(self._schedule_save)
         self._volume_slider.valueChanged.connect(self._schedule_save)
     
+    @staticmethod
+    def _add_spin_row(
+        layout: QVBoxLayout, label: str, minimum: int, maximum: int, value: int, suffix: str
+    ) -> QSpinBox:
+        """Add a labelled spin box row to a section and return the spin box."""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label))
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setValue(value)
+        spin.setSuffix(suffix)
+        row.addWidget(spin)
+        row.addStretch()
+        layout.addLayout(row)
+        return spin
+
+    def _update_volume_label(self, value: int) -> None:
+        self._volume_label.setText(f"{value}%")
+
     def _schedule_save(self) -> None:
         """Schedule auto-save after a short delay."""
         self._save_timer.start(500)  # Save 500ms after last change
 
+    def flush_pending_save(self) -> None:
+        """Save now if a debounced save is still waiting, e.g. on quit."""
+        # An unbuilt form has no inputs to read and nothing to save
+        if self._built and self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save()
+
+    def _on_browse_clicked(self) -> None:
+        self._browse_sound(self.sender().property(SOUND_TYPE))
+
+    def _on_test_clicked(self) -> None:
+        self.on_test_sound(self._sound_paths[self.sender().property(SOUND_TYPE)])
+
     def _browse_sound(self, sound_type: str) -> None:
         """Browse for sound file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -210,26 +241,21 @@ class SettingsView(QWidget):
             "Audio Files (*.mp3 *.wav *.ogg *.m4a)"
         )
         if file_path:
-            if sound_type == "low":
-                self._low_sound_path = file_path
-                self._low_sound_label.setText(Path(file_path).name)
-            else:
-                self._high_sound_path = file_path
-                self._high_sound_label.setText(Path(file_path).name)
+            self._sound_paths[sound_type] = file_path
+            self._sound_labels[sound_type].setText(Path(file_path).name)
             self._schedule_save()
 
     def _save(self) -> None:
         """Save settings."""
-        region_codes = ["us", "ous", "jp"]
         new_config = {
             "dexcom": {
                 "username": self._username.text(),
                 "password": self._password.text(),
-                "region": region_codes[self._region.currentIndex()],
+                "region": REGIONS[self._region.currentIndex()][0],
             },
             "alerts": {
-                "low_alert_sound": self._low_sound_path,
-                "high_alert_sound": self._high_sound_path,
+                "low_alert_sound": self._sound_paths["low"],
+                "high_alert_sound": self._sound_paths["high"],
                 "alert_repeat_count": self._repeat_spin.value(),
                 "alert_interval": self._interval_spin.value() * 60,
                 "min_volume": self._volume_slider.value(),
@@ -244,17 +270,31 @@ class SettingsView(QWidget):
     def update_config(self, config: Config) -> None:
         """Update with new config."""
         self.config = config
+        if not self._built:
+            return  # The form reads self.config when it is first built
+        
+        # Loading saved values is not an edit - keep them from scheduling another save
+        inputs = (
+            self._username, self._password, self._region, self._repeat_spin,
+            self._interval_spin, self._poll_spin, self._delay_spin, self._volume_slider,
+        )
+        for widget in inputs:
+            widget.blockSignals(True)
+        
         self._username.setText(config.dexcom.username)
         self._password.setText(config.dexcom.password)
-        region_index = {"us": 0, "ous": 1, "jp": 2}.get(config.dexcom.region, 0)
-        self._region.setCurrentIndex(region_index)
-        self._low_sound_path = config.alerts.low_alert_sound
-        self._low_sound_label.setText(Path(config.alerts.low_alert_sound).name)
-        self._high_sound_path = config.alerts.high_alert_sound
-        self._high_sound_label.setText(Path(config.alerts.high_alert_sound).name)
+        self._region.setCurrentIndex(REGION_INDEX.get(config.dexcom.region, 0))
+        self._sound_paths["low"] = config.alerts.low_alert_sound
+        self._sound_paths["high"] = config.alerts.high_alert_sound
+        for sound_type, path in self._sound_paths.items():
+            self._sound_labels[sound_type].setText(Path(path).name)
         self._repeat_spin.setValue(config.alerts.alert_repeat_count)
         self._interval_spin.setValue(config.alerts.alert_interval // 60)
         self._poll_spin.setValue(config.monitoring.poll_interval // 60)
         self._delay_spin.setValue(config.monitoring.startup_delay_minutes)
         self._volume_slider.setValue(config.alerts.min_volume)
+        self._update_volume_label(config.alerts.min_volume)
+        
+        for widget in inputs:
+            widget.blockSignals(False)
 
@@ -0,0 +1,16 @@
+"""Shared test fixtures."""
+
+import os
+
+import pytest
+
+# Widgets are built without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication that widget tests run under."""
+    from PySide6.QtWidgets import QApplication
+    
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,96 @@
+"""Tests for the main window's alert state machine."""
+
+import time
+
+import pytest
+
+from src.core import Config
+from src.ui_qt.app import BearAlarmApp
+
+
+class _RecordingAlerts:
+    """Alert system stand-in that records what it was asked to do."""
+
+    def __init__(self):
+        self.calls = []
+
+    def trigger_low_alert(self):
+        self.calls.append("low")
+
+    def trigger_high_alert(self):
+        self.calls.append("high")
+
+    def clear_alert(self):
+        self.calls.append("clear")
+
+
+class _Thresholds:
+    """Just the state _check_thresholds reads, with the real methods."""
+
+    _check_thresholds = BearAlarmApp._check_thresholds
+    _clear_alert = BearAlarmApp._clear_alert
+
+    def __init__(self, **alerts):
+        self.config = Config(alerts={"urgent_low": 2.8, "low_threshold": 3.9, "high_threshold": 15.0, **alerts})
+        self.alert_system = _RecordingAlerts()
+        self._snooze_until = None
+        self._snooze_until_monotonic = 0.0
+        self._alert_active = False
+        self._last_low_alert_start_time = None
+        self._last_high_alert_start_time = None
+
+    @property
+    def calls(self):
+        return self.alert_system.calls
+
+
+def test_in_range_does_nothing():
+    app = _Thresholds()
+    app._check_thresholds(6.0)
+    assert app.calls == []
+    assert app._last_low_alert_start_time is None
+    assert app._last_high_alert_start_time is None
+
+
+@pytest.mark.parametrize("value, expected", [(3.9, "low"), (2.0, "low"), (15.0, "high")])
+def test_thresholds_are_inclusive(value, expected):
+    app = _Thresholds()
+    app._check_thresholds(value)
+    assert app.calls == [expected]
+    assert app._alert_active
+
+
+def test_alert_clears_once_back_in_range():
+    app = _Thresholds()
+    app._check_thresholds(3.5)
+    app._check_thresholds(6.0)
+    app._check_thresholds(6.1)
+    assert app.calls == ["low", "clear"]
+    assert not app._alert_active
+    assert app._last_low_alert_start_time is None
+
+
+def test_pending_persistence_timer_resets_in_range():
+    app = _Thresholds(high_persist_minutes=20)
+    app._check_thresholds(16.0)
+    assert app.calls == []
+    assert app._last_high_alert_start_time is not None
+    
+    # Not the fast path: the running timer must be reset
+    app._check_thresholds(6.0)
+    assert app._last_high_alert_start_time is None
+
+
+def test_urgent_low_ignores_persistence():
+    app = _Thresholds(low_persist_minutes=30)
+    app._check_thresholds(3.5)
+    assert app.calls == []
+    app._check_thresholds(2.5)
+    assert app.calls == ["low"]
+
+
+def test_snooze_suppresses_alerts():
+    app = _Thresholds()
+    app._snooze_until_monotonic = time.monotonic() + 600
+    app._check_thresholds(2.0)
+    assert app.calls == []
@@ -0,0 +1,66 @@
+"""Tests for the configuration models."""
+
+from datetime import datetime
+
+from src.core.config import AlertsConfig, ScheduleConfig
+
+
+def test_thresholds_are_rounded_to_one_decimal():
+    alerts = AlertsConfig(urgent_low=2.75, low_threshold=3.85, high_threshold=10.04)
+    assert (alerts.urgent_low, alerts.low_threshold, alerts.high_threshold) == (2.8, 3.9, 10.0)
+
+
+def test_schedule_overrides_are_rounded_to_one_decimal():
+    schedule = ScheduleConfig(name="Work", low_threshold=4.26, high_threshold=None)
+    assert schedule.low_threshold == 4.3
+    assert schedule.high_threshold is None
+
+
+# 2024-01-01 is a Monday
+MONDAY_NOON = datetime(2024, 1, 1, 12, 0)
+MONDAY_NIGHT = datetime(2024, 1, 1, 23, 30)
+TUESDAY_EARLY = datetime(2024, 1, 2, 6, 0)
+SATURDAY_NOON = datetime(2024, 1, 6, 12, 0)
+
+
+def _alerts(*schedules: ScheduleConfig) -> AlertsConfig:
+    return AlertsConfig(
+        low_threshold=3.9,
+        high_threshold=15.0,
+        low_persist_minutes=5,
+        high_persist_minutes=20,
+        schedules=list(schedules),
+    )
+
+
+def test_defaults_apply_without_an_active_schedule():
+    work = ScheduleConfig(name="Work", start_time="09:00", end_time="17:00", low_threshold=4.5)
+    thresholds = _alerts(work).get_effective_thresholds(SATURDAY_NOON)
+    assert (thresholds.low_threshold, thresholds.high_threshold) == (3.9, 15.0)
+    assert (thresholds.low_persist_minutes, thresholds.high_persist_minutes) == (5, 20)
+
+
+def test_active_schedule_overrides_only_its_set_fields():
+    work = ScheduleConfig(name="Work", start_time="09:00", end_time="17:00", low_threshold=4.5, high_persist_minutes=0)
+    thresholds = _alerts(work).get_effective_thresholds(MONDAY_NOON)
+    assert (thresholds.low_threshold, thresholds.high_threshold) == (4.5, 15.0)
+    assert (thresholds.low_persist_minutes, thresholds.high_persist_minutes) == (5, 0)
+
+
+def test_overnight_schedule_spans_midnight():
+    night = ScheduleConfig(name="Night", start_time="23:00", end_time="07:00", days=list(range(7)), high_threshold=12.0)
+    alerts = _alerts(night)
+    assert alerts.get_effective_thresholds(MONDAY_NIGHT).high_threshold == 12.0
+    assert alerts.get_effective_thresholds(TUESDAY_EARLY).high_threshold == 12.0
+    assert alerts.get_effective_thresholds(MONDAY_NOON).high_threshold == 15.0
+
+
+def test_highest_priority_active_schedule_wins():
+    low = ScheduleConfig(name="Low", start_time="00:00", end_time="23:59", priority=1, low_threshold=4.0)
+    high = ScheduleConfig(name="High", start_time="00:00", end_time="23:59", priority=2, low_threshold=5.0)
+    assert _alerts(low, high).get_effective_thresholds(MONDAY_NOON).low_threshold == 5.0
+
+
+def test_disabled_schedule_is_ignored():
+    off = ScheduleConfig(name="Off", enabled=False, start_time="00:00", end_time="23:59", low_threshold=5.0)
+    assert _alerts(off).get_effective_thresholds(MONDAY_NOON).low_threshold == 3.9
@@ -0,0 +1,54 @@
+"""Tests for the history chart helpers."""
+
+import random
+
+import pytest
+
+from src.ui_qt.views.history import MAX_CHART_POINTS, _downsample
+
+
+def _readings(n: int) -> list:
+    """n readings in time order, with the low and high in the middle and a final hypo."""
+    readings = [(i, 5.0 + (i % 7) / 10) for i in range(n)]
+    if n > 2:
+        readings[n // 2] = (n // 2, 18.0)
+        readings[-1] = (n - 1, 2.0)
+    return readings
+
+
+def test_short_input_is_returned_unchanged():
+    readings = _readings(MAX_CHART_POINTS)
+    assert _downsample(readings) is readings
+
+
+@pytest.mark.parametrize("n", [401, 402, 862, 1000, 2015, 2016, 2099, 10000])
+def test_keeps_newest_reading_and_extremes(n):
+    readings = _readings(n)
+    reduced = _downsample(readings)
+    
+    assert len(reduced) <= MAX_CHART_POINTS
+    assert reduced[-1] == readings[-1]
+    assert min(v for _, v in reduced) == 2.0
+    assert max(v for _, v in reduced) == 18.0
+
+
+def test_keeps_newest_reading_for_every_size():
+    for n in range(MAX_CHART_POINTS + 1, 2100):
+        readings = _readings(n)
+        assert _downsample(readings)[-1] == readings[-1], n
+
+
+def test_reduced_points_stay_in_time_order():
+    reduced = _downsample(_readings(5000))
+    times = [ts for ts, _ in reduced]
+    assert times == sorted(times)
+
+
+def test_reduced_range_matches_full_range():
+    # refresh_data fits the y-axis to the reduced points, so they must span the same values
+    rng = random.Random(7)
+    for n in range(MAX_CHART_POINTS + 1, 2100, 37):
+        readings = [(i, round(rng.uniform(2.0, 22.0), 1)) for i in range(n)]
+        values = [v for _, v in _downsample(readings)]
+        assert min(values) == min(v for _, v in readings), n
+        assert max(values) == max(v for _, v in readings), n
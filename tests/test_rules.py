@@ -0,0 +1,51 @@
+"""Tests for the rules view helpers."""
+
+import pytest
+
+from src.core import ScheduleConfig
+from src.ui_qt.views import rules
+from src.ui_qt.views.rules import TIME_RE, ScheduleDialog
+
+
+@pytest.mark.parametrize("text", ["00:00", "9:00", "09:05", "12:30", "19:59", "23:59"])
+def test_time_re_accepts_24_hour_times(text):
+    assert TIME_RE.fullmatch(text)
+
+
+@pytest.mark.parametrize("text", ["", "9", "9.00", "24:00", "12:60", "1:5", "123:00", "12:345", " 9:00"])
+def test_time_re_rejects_malformed_times(text):
+    assert not TIME_RE.fullmatch(text)
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    """Record warning dialogs instead of showing them modally."""
+    shown = []
+    monkeypatch.setattr(rules.QMessageBox, "warning", lambda *args: shown.append(args))
+    return shown
+
+
+def _dialog(start: str, end: str) -> ScheduleDialog:
+    dialog = ScheduleDialog()
+    dialog.load(ScheduleConfig(name="Work"))
+    dialog._start_edit.setText(start)
+    dialog._end_edit.setText(end)
+    return dialog
+
+
+def test_dialog_rejects_malformed_time(qapp, warnings):
+    dialog = _dialog("9.00", "17:00")
+    dialog.accept()
+    assert dialog.result() != ScheduleDialog.DialogCode.Accepted
+    assert len(warnings) == 1
+
+
+def test_dialog_accepts_valid_and_empty_times(qapp, warnings):
+    dialog = _dialog("", "17:00")
+    dialog.accept()
+    assert dialog.result() == ScheduleDialog.DialogCode.Accepted
+    assert not warnings
+    
+    schedule = ScheduleConfig(name="Work")
+    dialog.apply(schedule, "Schedule")
+    assert (schedule.start_time, schedule.end_time) == ("00:00", "17:00")
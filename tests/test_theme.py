@@ -0,0 +1,31 @@
+"""Tests for the theme helpers."""
+
+import pytest
+
+from src.ui_qt.theme import COLORS, get_glucose_color
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (2.0, COLORS.glucose_low),
+        (3.9, COLORS.glucose_low),  # low is inclusive
+        (4.0, COLORS.glucose_normal),
+        (9.9, COLORS.glucose_normal),
+        (10.0, COLORS.glucose_high),  # high is inclusive
+        (22.0, COLORS.glucose_high),
+    ],
+)
+def test_default_thresholds(value, expected):
+    assert get_glucose_color(value) == expected
+
+
+def test_custom_thresholds():
+    assert get_glucose_color(4.5, low=5.0, high=8.0) == COLORS.glucose_low
+    assert get_glucose_color(6.0, low=5.0, high=8.0) == COLORS.glucose_normal
+    assert get_glucose_color(8.0, low=5.0, high=8.0) == COLORS.glucose_high
+
+
+def test_low_wins_when_thresholds_overlap():
+    # A value past both thresholds is still shown as low
+    assert get_glucose_color(6.0, low=7.0, high=5.0) == COLORS.glucose_low